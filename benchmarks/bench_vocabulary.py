@@ -0,0 +1,51 @@
+"""Compare the scalar and vectorized vocabulary generators across lexicon sizes.
+
+The scalar loop drops duplicate words, so its lexicon stops growing once the
+phoneme space is exhausted; throughput is reported per unique word kept.
+
+Run from the repository root:
+
+    python benchmarks/bench_vocabulary.py [--sizes 1000 10000 100000] [--family elvish]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from language_generator import AncientLanguageGenerator
+
+
+def time_call(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--family", default="elvish")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    generator = AncientLanguageGenerator(args.seed)
+    phonemes = generator.phonemes[args.family]
+
+    # Warm up NumPy so its import is not billed to the first size
+    generator._generate_vocabulary_vectorized(phonemes, 10, seed=args.seed)
+
+    print(f"{'words':>10} {'loop s':>9} {'loop kept':>10} {'loop w/s':>10} "
+          f"{'numpy s':>9} {'numpy kept':>11} {'numpy w/s':>10}")
+    for size in args.sizes:
+        loop_time, loop_vocab = time_call(generator._generate_vocabulary, phonemes, size)
+        numpy_time, numpy_vocab = time_call(
+            generator._generate_vocabulary_vectorized, phonemes, size, seed=args.seed
+        )
+        print(f"{size:>10} {loop_time:>9.3f} {len(loop_vocab):>10} {len(loop_vocab) / loop_time:>10.0f} "
+              f"{numpy_time:>9.3f} {len(numpy_vocab):>11} {len(numpy_vocab) / numpy_time:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""Headless multi-session load harness for the Streamlit app.
+
+Drives N simulated sessions through the four tabs with randomized inputs,
+using streamlit.testing.v1.AppTest so everything runs in-process and
+offline. Sessions stay alive for the whole run and take turns, one
+interaction per session per round, so the server holds all of them at
+once just like concurrent users. Reports per-interaction latency
+percentiles, rerun counts and per-session memory growth.
+
+Run from the repository root:
+
+    python benchmarks/load_app.py --sessions 20 --rounds 10 [--workers 4] [--json load.json]
+
+AppTest installs a process-global runtime for each rerun, so it cannot
+drive sessions from several threads at once. With --workers > 1 the
+sessions are split across worker processes instead; each process behaves
+like its own app server, with its own caches and shared language registry.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from streamlit import logger as streamlit_logger
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "app.py")
+
+FAMILIES = ["elvish", "dwarvish", "demonic", "celestial"]
+SCRIPTS = ["runic", "alchemical", "geometric", "astrological"]
+NAMES = ["Elvish", "Dragon Tongue", "Deep Speech", "Skyborn", "Ashen Cant"]
+PHRASES = [
+    "Magic is real", "Protect this treasure", "The sky is beautiful today",
+    "Fire and water bring life and death", "Only the worthy may pass",
+]
+
+
+def _widget(widgets, label):
+    for widget in widgets:
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No widget labelled {label!r}")
+
+
+def _click(at, label):
+    _widget(at.button, label).click()
+    at.run()
+
+
+class Session:
+    """One simulated browser session and its measurements"""
+
+    def __init__(self, session_id, rng, timeout):
+        self.session_id = session_id
+        self.rng = rng
+        self.app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.reruns = 0
+        self.memory_growth = 0
+        self.errors = []
+
+    def create_language(self):
+        at = self.app
+        _widget(at.text_input, "Language Name").set_value(self.rng.choice(NAMES))
+        _widget(at.selectbox, "Language Family").set_value(self.rng.choice(FAMILIES))
+        # Mostly seeded, from a small pool, so shared caches get realistic hit rates
+        seed = self.rng.choice([None, 1, 2, 3, 4, 5, 6, 7, 8])
+        _widget(at.number_input, "Random Seed (optional)").set_value(seed)
+        _click(at, "Create Language")
+
+    def generate_runes(self):
+        at = self.app
+        _widget(at.text_area, "Text to convert to runes").set_value(self.rng.choice(PHRASES))
+        _widget(at.selectbox, "Script Type").set_value(self.rng.choice(SCRIPTS))
+        _click(at, "Generate Runes")
+
+    def translate(self):
+        at = self.app
+        if "current_language" not in at.session_state:
+            self.create_language()
+            self.reruns += 1
+        _widget(at.text_area, "English text to translate").set_value(self.rng.choice(PHRASES))
+        _click(at, "Translate")
+
+    def create_family(self):
+        at = self.app
+        _widget(at.text_input, "Base Language Name").set_value(self.rng.choice(NAMES))
+        _widget(at.slider, "Number of related languages").set_value(self.rng.randint(2, 5))
+        _click(at, "Create Language Family")
+
+    INTERACTIONS = ["create_language", "generate_runes", "translate", "create_family"]
+
+    def start(self):
+        self.app.run()
+        self.reruns += 1
+
+    def step(self):
+        """Perform one random interaction, returning (name, seconds)"""
+        name = self.rng.choice(self.INTERACTIONS)
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            getattr(self, name)()
+        except Exception as error:  # keep driving the other sessions
+            self.errors.append(f"{name}: {error!r}")
+        elapsed = time.perf_counter() - start
+        self.memory_growth += tracemalloc.get_traced_memory()[0] - before
+        self.reruns += 1
+        if self.app.exception:
+            self.errors.append(f"{name}: {self.app.exception[0].message}")
+        return name, elapsed
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def drive_sessions(session_ids, seeds, rounds, timeout, trace_memory=True):
+    """Run a group of sessions round-robin in this process and return raw measurements"""
+    # Bare-mode AppTest runs log a warning per widget access; keep the report readable
+    streamlit_logger.set_log_level("error")
+    if trace_memory:
+        tracemalloc.start()
+    baseline_memory = tracemalloc.get_traced_memory()[0]
+
+    clients = [Session(i, random.Random(seed), timeout) for i, seed in zip(session_ids, seeds)]
+    for client in clients:
+        client.start()
+
+    latencies = {}
+    for _ in range(rounds):
+        for client in clients:
+            name, elapsed = client.step()
+            latencies.setdefault(name, []).append(elapsed)
+
+    total_memory = tracemalloc.get_traced_memory()[0] - baseline_memory
+    if trace_memory:
+        tracemalloc.stop()
+    return {
+        "latencies": latencies,
+        "reruns": sum(client.reruns for client in clients),
+        "growth": [client.memory_growth for client in clients],
+        "process_growth": total_memory,
+        "errors": [f"session {client.session_id}: {error}" for client in clients for error in client.errors],
+    }
+
+
+def run(sessions, rounds, workers, seed, timeout, trace_memory=True):
+    master = random.Random(seed)
+    seeds = [master.getrandbits(64) for _ in range(sessions)]
+    workers = max(1, min(workers, sessions))
+
+    # Deal sessions out to workers; each group is driven by one process
+    groups = [(list(range(w, sessions, workers)), seeds[w::workers]) for w in range(workers)]
+    if workers == 1:
+        parts = [drive_sessions(*groups[0], rounds, timeout, trace_memory)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(drive_sessions, ids, group_seeds, rounds, timeout, trace_memory)
+                       for ids, group_seeds in groups]
+            parts = [future.result() for future in futures]
+
+    latencies = {}
+    for part in parts:
+        for name, values in part["latencies"].items():
+            latencies.setdefault(name, []).extend(values)
+    growth = [value for part in parts for value in part["growth"]]
+
+    return {
+        "sessions": sessions,
+        "rounds": rounds,
+        "workers": workers,
+        "interactions": {
+            name: {
+                "count": len(values),
+                "p50_ms": percentile(values, 0.50) * 1000,
+                "p90_ms": percentile(values, 0.90) * 1000,
+                "p99_ms": percentile(values, 0.99) * 1000,
+                "max_ms": max(values) * 1000,
+            }
+            for name, values in sorted(latencies.items())
+        },
+        "reruns": sum(part["reruns"] for part in parts),
+        "session_memory_growth_bytes": {
+            "mean": sum(growth) / len(growth),
+            "max": max(growth),
+        },
+        "process_memory_growth_bytes": sum(part["process_growth"] for part in parts),
+        "errors": [error for part in parts for error in part["errors"]],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=5, help="interactions per session")
+    parser.add_argument("--workers", type=int, default=1, help="processes driving sessions concurrently")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per rerun")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip tracemalloc, which slows every interaction, for cleaner latencies")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    report = run(args.sessions, args.rounds, args.workers, args.seed, args.timeout,
+                 trace_memory=not args.no_memory)
+
+    print(f"{args.sessions} sessions x {args.rounds} rounds, {args.workers} worker(s), "
+          f"{report['reruns']} reruns")
+    print(f"{'interaction':<18} {'count':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for name, stats in report["interactions"].items():
+        print(f"{name:<18} {stats['count']:>6} {stats['p50_ms']:>9.1f} {stats['p90_ms']:>9.1f} "
+              f"{stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}")
+    growth = report["session_memory_growth_bytes"]
+    if args.no_memory:
+        print("memory growth not traced (--no-memory)")
+    else:
+        print(f"memory growth per session: mean {growth['mean'] / 1024:.1f} KiB, "
+              f"max {growth['max'] / 1024:.1f} KiB; "
+              f"process {report['process_memory_growth_bytes'] / 1024:.1f} KiB")
+    for error in report["errors"]:
+        print(f"ERROR {error}")
+
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(report, handle, indent=2)
+
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
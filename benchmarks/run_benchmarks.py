@@ -0,0 +1,318 @@
+"""Micro-benchmarks for the generator hot paths with baseline regression checks.
+
+Each case runs one public entry point across a sweep of input sizes and
+records the best wall time, throughput (units per second) and peak traced
+memory. Results can be saved as a JSON baseline; later runs compare against
+it and exit with status 1 when throughput drops or peak memory grows by more
+than the threshold.
+
+Run from the repository root:
+
+    python benchmarks/run_benchmarks.py --save-baseline      # record benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --threshold 0.25     # compare against it
+    python benchmarks/run_benchmarks.py --filter rune --json results.json
+
+Every run also times a cold start (imports plus one of each generator) in a
+fresh interpreter and fails when it exceeds --cold-start-budget, since
+workers and app sessions are started all the time.
+"""
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from dictionary_builder import build_dictionary
+from language_generator import AncientLanguageGenerator
+from lore_generator import LoreGenerator
+from rune_maker import RuneGenerator
+from translator import LinguisticTranslator
+from vocabulary import LazyVocabulary
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Seconds a fresh interpreter may spend importing the package and building
+# one of each generator (interpreter start-up itself is not counted)
+COLD_START_BUDGET = 0.1
+
+COLD_START_SCRIPT = """
+import time
+start = time.perf_counter()
+from language_generator import AncientLanguageGenerator
+from lore_generator import LoreGenerator
+from rune_maker import RuneGenerator
+from translator import LinguisticTranslator
+LinguisticTranslator(AncientLanguageGenerator())
+RuneGenerator()
+LoreGenerator()
+print(time.perf_counter() - start)
+"""
+
+SAMPLE_TEXT = "the ancient gate opens only beneath the twin moons of the sky "
+
+
+def _language(word_count, vectorized=True):
+    generator = AncientLanguageGenerator(42)
+    generator.generate_language("Bench", "elvish", word_count=word_count, vectorized=vectorized)
+    return generator
+
+
+# Each case: name -> (sizes, unit, setup(size) -> zero-argument callable)
+def _generate_language_loop(size):
+    generator = AncientLanguageGenerator(42)
+    return lambda: generator.generate_language("Bench", word_count=size)
+
+
+def _generate_language_vectorized(size):
+    generator = AncientLanguageGenerator(42)
+    return lambda: generator.generate_language("Bench", word_count=size, vectorized=True)
+
+
+def _generate_language_phonotactic(size):
+    generator = AncientLanguageGenerator(42)
+    generator.generate_language("Warmup", word_count=10, phonotactic=True)  # load the model first
+    return lambda: generator.generate_language("Bench", word_count=size, phonotactic=True)
+
+
+def _lazy_words(size):
+    phonemes = AncientLanguageGenerator().phonemes["elvish"]
+
+    def spell():
+        # A fresh vocabulary each run, so every word is spelled rather than cached
+        vocabulary = LazyVocabulary(phonemes, AncientLanguageGenerator.AFFIXES, 42)
+        for index in range(size):
+            vocabulary.word_at(index * 7919)
+    return spell
+
+
+def _generate_sentences(size):
+    generator = _language(size)
+    generator.generate_sentence("Bench")  # build the POS index outside the timing
+    return lambda: generator.generate_sentences("Bench", 1000, complexity=2)
+
+
+def _translate(size):
+    generator = _language(1000)
+    translator = LinguisticTranslator(generator)
+    english = [f"word{i}" for i in range(500)] + SAMPLE_TEXT.split()
+    translator.create_translation_system("Bench", english)
+    words = SAMPLE_TEXT.split()
+    text = " ".join(words[i % len(words)] for i in range(size))
+    return lambda: translator.translate_to_ancient(text, "Bench")
+
+
+def _inscription_sheet(size):
+    generator = _language(1000)
+    translator = LinguisticTranslator(generator)
+    translator.create_translation_system("Bench", [f"word{i}" for i in range(500)] + SAMPLE_TEXT.split())
+    lines = [SAMPLE_TEXT] * size
+    return lambda: sum(1 for _ in translator.inscription_pipeline("Bench").stream(lines))
+
+
+def _edit_document(size):
+    generator = _language(1000)
+    translator = LinguisticTranslator(generator)
+    translator.create_translation_system("Bench", [f"word{i}" for i in range(500)] + SAMPLE_TEXT.split())
+    lines = [f"{SAMPLE_TEXT} {i}" for i in range(size)]
+    edits = iter(range(1 << 62))
+
+    def edit():
+        # One line changes between calls, as when typing into a long document
+        lines[next(edits) % size] += " sky"
+        translator.translate_incremental("\n".join(lines), "Bench")
+    return edit
+
+
+def _build_dictionary(size):
+    tags = ["n", "n", "n", "v", "v", "adj", "adv", "prep"]
+    lexicon = "".join(f"entry{i}\t{tags[i % len(tags)]}\n" for i in range(size))
+
+    def build():
+        generator = _language(100)
+        build_dictionary(generator, "Bench", io.StringIO(lexicon), seed=1)
+    return build
+
+
+def _decode_runes(size):
+    generator = _language(10000)
+    translator = LinguisticTranslator(generator)
+    pairs = translator.create_translation_system("Bench", [f"word{i}" for i in range(5000)])
+    runes = RuneGenerator().generate_rune_script(" ".join(pairs[i % len(pairs)][1] for i in range(size)))
+    translator.rune_decoder("Bench")  # built once per language and script
+    return lambda: translator.translate_from_runes(runes, "Bench")
+
+
+def _rune_script(size):
+    rune_gen = RuneGenerator()
+    text = (SAMPLE_TEXT * (size // len(SAMPLE_TEXT) + 1))[:size]
+    return lambda: rune_gen.generate_rune_script(text, "runic")
+
+
+def _rune_circle(size):
+    rune_gen = RuneGenerator()
+    return lambda: rune_gen.generate_rune_circle("Magic is real", size)
+
+
+def _rune_lore(size):
+    lore_gen = LoreGenerator(42)
+    runes = RuneGenerator().generate_rune_script((SAMPLE_TEXT * (size // len(SAMPLE_TEXT) + 1))[:size])
+    return lambda: lore_gen.generate_rune_lore(runes, "protection")
+
+
+def _language_family(size):
+    generator = AncientLanguageGenerator(42)
+    return lambda: generator.create_language_family("Bench", size)
+
+
+def _construct_generators(size):
+    def construct():
+        for seed in range(size):
+            LinguisticTranslator(AncientLanguageGenerator(seed))
+            RuneGenerator(seed)
+            LoreGenerator(seed)
+    return construct
+
+
+def _language_tree(size):
+    def evolve():
+        generator = _language(10000)
+        # Build `size` dialects: 5 branches, then enough children per branch
+        tree = generator.create_language_tree("Bench", branching=(5, max(1, size // 5)))
+        tree.build_level(tree.depth)
+    return evolve
+
+
+CASES = {
+    "generate_language[loop]": ([100, 1000, 10000], "words", _generate_language_loop),
+    "generate_language[vectorized]": ([1000, 10000, 100000], "words", _generate_language_vectorized),
+    "generate_language[phonotactic]": ([1000, 10000, 100000], "words", _generate_language_phonotactic),
+    "LazyVocabulary.word_at": ([1000, 10000, 100000], "words", _lazy_words),
+    "generate_sentences": ([100, 10000, 100000], "vocabulary words", _generate_sentences),
+    "translate_to_ancient": ([10, 1000, 100000], "words", _translate),
+    "inscription_pipeline": ([100, 10000, 100000], "lines", _inscription_sheet),
+    "translate_incremental": ([100, 1000, 10000], "lines", _edit_document),
+    "build_dictionary": ([1000, 10000, 100000], "entries", _build_dictionary),
+    "translate_from_runes": ([100, 1000, 10000], "words", _decode_runes),
+    "generate_rune_script": ([1000, 100000, 1000000], "chars", _rune_script),
+    "generate_rune_circle": ([25, 200, 1000], "diameter", _rune_circle),
+    "generate_rune_lore": ([100, 10000, 100000], "runes", _rune_lore),
+    "create_language_family": ([3, 10, 30], "languages", _language_family),
+    "construct_generators": ([100, 1000, 10000], "sessions", _construct_generators),
+    "evolve_language_tree": ([10, 50, 250], "dialects", _language_tree),
+}
+
+
+def measure(setup, size, repeat):
+    """Best-of-`repeat` wall time, then one traced run for peak memory"""
+    func = setup(size)
+    func()  # warm caches and lazy imports
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run(case_filter=None, repeat=5, quick=False):
+    results = {}
+    for name, (sizes, unit, setup) in CASES.items():
+        if case_filter and case_filter not in name:
+            continue
+        for size in sizes[:2] if quick else sizes:
+            seconds, peak = measure(setup, size, repeat)
+            key = f"{name}@{size}"
+            results[key] = {
+                "seconds": seconds,
+                "throughput": size / seconds if seconds else float("inf"),
+                "unit": unit,
+                "peak_bytes": peak,
+            }
+            print(f"{key:<42} {seconds * 1000:>10.3f} ms {size / seconds:>14.0f} {unit}/s "
+                  f"{peak / 1024:>10.1f} KiB peak")
+    return results
+
+
+def cold_start(repeat=5):
+    """Best-of-`repeat` seconds to import the package and build its generators in a new process"""
+    best = float("inf")
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, "-c", COLD_START_SCRIPT], cwd=SRC_DIR,
+                                   capture_output=True, text=True, check=True)
+        best = min(best, float(completed.stdout))
+    return best
+
+
+def compare(results, baseline, threshold):
+    """Return a list of human-readable regressions against the baseline"""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if current["throughput"] < previous["throughput"] * (1 - threshold):
+            regressions.append(f"{key}: throughput {current['throughput']:.0f} < "
+                               f"baseline {previous['throughput']:.0f} {current['unit']}/s")
+        if current["peak_bytes"] > previous["peak_bytes"] * (1 + threshold):
+            regressions.append(f"{key}: peak memory {current['peak_bytes']} > "
+                               f"baseline {previous['peak_bytes']} bytes")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed relative regression before failing (default 0.25)")
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="only run the two smallest sizes")
+    parser.add_argument("--json", help="also write this run's results to a JSON file")
+    parser.add_argument("--cold-start-budget", type=float, default=COLD_START_BUDGET,
+                        help=f"fail when a cold start takes longer, in seconds (default {COLD_START_BUDGET})")
+    args = parser.parse_args()
+
+    results = run(args.filter, args.repeat, args.quick)
+    startup = cold_start(args.repeat)
+    print(f"{'cold_start':<42} {startup * 1000:>10.3f} ms (budget {args.cold_start_budget * 1000:.0f} ms)")
+    regressions = []
+    if startup > args.cold_start_budget:
+        regressions.append(f"cold start {startup * 1000:.1f} ms > budget {args.cold_start_budget * 1000:.0f} ms")
+
+    if args.json:
+        with open(args.json, "w") as handle:
+            json.dump(results, handle, indent=2)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as handle:
+                baseline = json.load(handle)
+        baseline.update(results)
+        with open(args.baseline, "w") as handle:
+            json.dump(baseline, handle, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+    elif not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+    else:
+        with open(args.baseline) as handle:
+            regressions += compare(results, json.load(handle), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
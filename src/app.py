@@ -1,9 +1,12 @@
 import streamlit as st
 import random
+from itertools import islice
 from language_generator import AncientLanguageGenerator
 from rune_maker import RuneGenerator
-from lore_generator import LoreGenerator
+from lore_generator import LoreGenerator, analyze_runes
 from translator import LinguisticTranslator
+from language_registry import shared_languages
+import instrumentation
 
 # Set page config
 st.set_page_config(
@@ -12,6 +15,48 @@ st.set_page_config(
     layout="wide"
 )
 
+# Process-wide caches for reruns: every entry is keyed by the full input tuple
+# and the oldest entries are evicted once a cache holds CACHE_ENTRIES results
+CACHE_ENTRIES = 128
+
+DEFAULT_ENGLISH_WORDS = ["sky", "earth", "fire", "water", "light",
+                         "dark", "life", "death", "beautiful", "today"]
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, show_spinner=False)
+def describe_seeded_language(name: str, family: str, seed: int, _language):
+    """Lore and an example sentence for a shared seeded language"""
+    language_gen = AncientLanguageGenerator(seed)
+    language_gen.languages[name] = _language
+    lore = LoreGenerator(seed).generate_language_lore(_language)
+    return lore, language_gen.generate_sentence(name)
+
+
+@st.cache_data(max_entries=CACHE_ENTRIES, show_spinner=False)
+def create_inscription(text: str, script_type: str):
+    """Runes, circle, sigil, statistics and lore for one text and script"""
+    rune_gen = RuneGenerator()
+    runic_text = rune_gen.generate_rune_script(text, script_type)
+    rune_stats = analyze_runes(runic_text)
+    # Lore is seeded from the inputs so a cached answer is also a reproducible one
+    lore = LoreGenerator(f"{script_type}:{text}").generate_rune_lore(runic_text, text, rune_stats)
+    return (runic_text, rune_gen.generate_rune_circle(text),
+            rune_gen.generate_magic_sigil(text), rune_stats, lore)
+
+
+def translate_text(lang_name: str, text: str, translator: LinguisticTranslator):
+    """Translation, bilingual inscription, dictionary sample and line-cache stats for one text.
+
+    Not st.cache_data: each edit would be a whole-text miss. The translator's
+    own line cache re-translates only the lines that changed since the last rerun.
+    """
+    if lang_name not in translator.translation_models:
+        translator.create_translation_system(lang_name, DEFAULT_ENGLISH_WORDS)
+    translated, bilingual = translator.translate_incremental(text, lang_name)
+    return (translated, bilingual, translator.translation_models[lang_name][:10],
+            translator.incremental_translator(lang_name).stats())
+
+
 # Initialize components with session state
 if 'language_gen' not in st.session_state:
     st.session_state.language_gen = AncientLanguageGenerator()
@@ -22,211 +67,277 @@ if 'lore_gen' not in st.session_state:
 if 'translator' not in st.session_state:
     st.session_state.translator = LinguisticTranslator(st.session_state.language_gen)
 
-# Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 3rem;
-        color: #8A2BE2;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .rune-display {
-        font-family: 'Courier New', monospace;
-        font-size: 1.5rem;
-        background-color: #f0f0f0;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        text-align: center;
-    }
-    .language-card {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #8A2BE2;
-        margin-bottom: 1rem;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Header
-st.markdown('<h1 class="main-header">🔮 Linguistic Alchemy</h1>', unsafe_allow_html=True)
-st.markdown("### Generate Ancient Languages, Runic Scripts, and Magical Lore")
-
-# Create tabs
-tab1, tab2, tab3, tab4 = st.tabs([
-    "Language Creator", 
-    "Rune Generator", 
-    "Translator", 
-    "Language Family"
-])
-
-with tab1:
-    st.header("Create Ancient Languages")
-    
-    col1, col2 = st.columns(2)
+# A profile requested from the sidebar covers this whole rerun
+rerun_capture = None
+if st.session_state.pop('profile_next_rerun', False):
+    try:
+        rerun_capture = instrumentation.Capture(profile=True, memory=True).start()
+    except RuntimeError as error:
+        # Another session's rerun is being profiled in this process
+        st.warning(f"Profiling skipped: {error}")
+
+# The page body runs inside try/finally so the capture is stopped even when
+# the rerun ends early (st.rerun, st.stop or an exception)
+try:
+    # Custom CSS
+    st.markdown("""
+    <style>
+        .main-header {
+            font-size: 3rem;
+            color: #8A2BE2;
+            text-align: center;
+            margin-bottom: 2rem;
+        }
+        .rune-display {
+            font-family: 'Courier New', monospace;
+            font-size: 1.5rem;
+            background-color: #f0f0f0;
+            padding: 1rem;
+            border-radius: 0.5rem;
+            text-align: center;
+        }
+        .language-card {
+            background-color: #f8f9fa;
+            padding: 1rem;
+            border-radius: 0.5rem;
+            border-left: 4px solid #8A2BE2;
+            margin-bottom: 1rem;
+        }
+    </style>
+    """, unsafe_allow_html=True)
+
+    # Header
+    st.markdown('<h1 class="main-header">🔮 Linguistic Alchemy</h1>', unsafe_allow_html=True)
+    st.markdown("### Generate Ancient Languages, Runic Scripts, and Magical Lore")
+
+    # Create tabs
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "Language Creator", 
+        "Rune Generator", 
+        "Translator", 
+        "Language Family"
+    ])
+
+    with tab1:
+        st.header("Create Ancient Languages")
     
-    with col1:
-        language_name = st.text_input("Language Name", "Elvish")
-        language_family = st.selectbox(
-            "Language Family",
-            ["elvish", "dwarvish", "demonic", "celestial"]
-        )
-        seed = st.number_input("Random Seed (optional)", min_value=0, value=None)
-        generate_btn = st.button("Create Language", type="primary")
+        col1, col2 = st.columns(2)
     
-    if generate_btn:
-        with st.spinner("Weaving linguistic magic..."):
-            if seed is not None:
-                st.session_state.language_gen = AncientLanguageGenerator(seed)
-            
-            language = st.session_state.language_gen.generate_language(
-                language_name, language_family
+        with col1:
+            language_name = st.text_input("Language Name", "Elvish")
+            language_family = st.selectbox(
+                "Language Family",
+                ["elvish", "dwarvish", "demonic", "celestial"]
             )
-            lore = st.session_state.lore_gen.generate_language_lore(language)
-            example_sentence = st.session_state.language_gen.generate_sentence(language_name)
+            seed = st.number_input("Random Seed (optional)", min_value=0, value=None)
+            generate_btn = st.button("Create Language", type="primary")
+    
+        if generate_btn:
+            with st.spinner("Weaving linguistic magic..."):
+                language_gen = st.session_state.language_gen
+                # The session drops its previous shared language before taking a new one
+                if 'language_handle' in st.session_state:
+                    st.session_state.pop('language_handle').release()
+
+                if seed is not None:
+                    # Seeded languages are deterministic, so one copy serves every session
+                    seed = int(seed)
+                    handle = shared_languages.acquire(language_name, language_family, seed)
+                    st.session_state.language_handle = handle
+                    language = handle.language
+                    lore, example_sentence = describe_seeded_language(
+                        language_name, language_family, seed, language
+                    )
+                    language_gen.languages[language_name] = language
+                    language_gen.invalidate_pos_index(language_name)
+                else:
+                    language = language_gen.generate_language(language_name, language_family)
+                    lore = st.session_state.lore_gen.generate_language_lore(language)
+                    example_sentence = language_gen.generate_sentence(language_name)
             
-            st.session_state.current_language = language
+                st.session_state.current_language = language
+                st.session_state.translator.translation_models.pop(language_name, None)
             
-            with col2:
-                st.markdown(f'<div class="language-card">', unsafe_allow_html=True)
-                st.subheader(f"✨ {language['name']}")
-                st.write(f"**Family:** {language['family']}")
-                st.write(f"**Grammar:** {language['grammar_type']}")
-                st.write(f"**Writing System:** {language['script']}")
-                st.write(f"**Plural Rules:** {language['morphology']['plural_rules']}")
-                st.markdown('</div>', unsafe_allow_html=True)
+                with col2:
+                    st.markdown(f'<div class="language-card">', unsafe_allow_html=True)
+                    st.subheader(f"✨ {language['name']}")
+                    st.write(f"**Family:** {language['family']}")
+                    st.write(f"**Grammar:** {language['grammar_type']}")
+                    st.write(f"**Writing System:** {language['script']}")
+                    st.write(f"**Plural Rules:** {language['morphology']['plural_rules']}")
+                    st.markdown('</div>', unsafe_allow_html=True)
                 
-                st.subheader("Example Sentence")
-                st.info(example_sentence)
+                    st.subheader("Example Sentence")
+                    st.info(example_sentence)
                 
-                st.subheader("Language Lore")
-                st.write(lore)
+                    st.subheader("Language Lore")
+                    st.write(lore)
                 
-                # Show some vocabulary
-                st.subheader("Sample Vocabulary")
-                vocab_sample = dict(list(language['vocabulary'].items())[:10])
-                st.json(vocab_sample)
+                    # Show some vocabulary
+                    st.subheader("Sample Vocabulary")
+                    vocab_sample = dict(islice(language['vocabulary'].items(), 10))
+                    st.json(vocab_sample)
 
-with tab2:
-    st.header("Generate Runic Inscriptions")
+    with tab2:
+        st.header("Generate Runic Inscriptions")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        text_to_convert = st.text_area("Text to convert to runes", "Magic is real")
-        script_type = st.selectbox(
-            "Script Type",
-            ["runic", "alchemical", "geometric", "astrological"]
-        )
-        generate_runes_btn = st.button("Generate Runes", type="primary")
+        with col1:
+            text_to_convert = st.text_area("Text to convert to runes", "Magic is real")
+            script_type = st.selectbox(
+                "Script Type",
+                ["runic", "alchemical", "geometric", "astrological"]
+            )
+            generate_runes_btn = st.button("Generate Runes", type="primary")
     
-    if generate_runes_btn and text_to_convert:
-        with st.spinner("Carving ancient symbols..."):
-            runic_text = st.session_state.rune_gen.generate_rune_script(text_to_convert, script_type)
-            rune_circle = st.session_state.rune_gen.generate_rune_circle(text_to_convert)
-            sigil = st.session_state.rune_gen.generate_magic_sigil(text_to_convert)
-            lore = st.session_state.lore_gen.generate_rune_lore(runic_text, text_to_convert)
+        if generate_runes_btn and text_to_convert:
+            with st.spinner("Carving ancient symbols..."):
+                runic_text, rune_circle, sigil, rune_stats, lore = create_inscription(
+                    text_to_convert, script_type
+                )
             
-            with col2:
-                st.subheader("Runic Translation")
-                st.markdown(f'<div class="rune-display">{runic_text}</div>', unsafe_allow_html=True)
+                with col2:
+                    st.subheader("Runic Translation")
+                    st.markdown(f'<div class="rune-display">{runic_text}</div>', unsafe_allow_html=True)
                 
-                st.subheader("Magic Sigil")
-                st.markdown(f'<div class="rune-display">{sigil}</div>', unsafe_allow_html=True)
+                    st.subheader("Magic Sigil")
+                    st.markdown(f'<div class="rune-display">{sigil}</div>', unsafe_allow_html=True)
                 
-                st.subheader("Circular Inscription")
-                st.code(rune_circle)
+                    st.subheader("Circular Inscription")
+                    st.code(rune_circle)
                 
-                st.subheader("Lore of the Runes")
-                st.write(lore)
+                    st.subheader("Lore of the Runes")
+                    st.write(lore)
+                    st.caption(f"{rune_stats.total} runes, {rune_stats.unique} distinct symbols")
 
-with tab3:
-    st.header("Ancient Language Translator")
+    with tab3:
+        st.header("Ancient Language Translator")
     
-    if 'current_language' not in st.session_state:
-        st.warning("Create a language first in the 'Language Creator' tab!")
-    else:
-        col1, col2 = st.columns(2)
+        if 'current_language' not in st.session_state:
+            st.warning("Create a language first in the 'Language Creator' tab!")
+        else:
+            col1, col2 = st.columns(2)
         
-        with col1:
-            english_text = st.text_area("English text to translate", "The sky is beautiful today")
-            translate_btn = st.button("Translate", type="primary")
+            with col1:
+                english_text = st.text_area("English text to translate", "The sky is beautiful today")
+                translate_btn = st.button("Translate", type="primary")
+                live_preview = st.checkbox("Live preview", value=False,
+                                           help="Re-translate on every edit; unchanged lines are reused")
         
-        if translate_btn:
-            with st.spinner("Deciphering ancient texts..."):
-                # Ensure translation model exists
-                lang_name = st.session_state.current_language['name']
-                if lang_name not in st.session_state.translator.translation_models:
-                    english_words = ["sky", "earth", "fire", "water", "light", 
-                                   "dark", "life", "death", "beautiful", "today"]
-                    st.session_state.translator.create_translation_system(lang_name, english_words)
-                
-                translated = st.session_state.translator.translate_to_ancient(english_text, lang_name)
-                bilingual = st.session_state.translator.create_bilingual_inscription(english_text, lang_name)
+            if translate_btn or live_preview:
+                with st.spinner("Deciphering ancient texts..."):
+                    # The translation model is built on the first miss for this language
+                    translated, bilingual, dictionary_sample, line_stats = translate_text(
+                        st.session_state.current_language["name"], english_text, st.session_state.translator
+                    )
                 
-                with col2:
-                    st.subheader("Translation")
-                    st.info(translated)
+                    with col2:
+                        st.subheader("Translation")
+                        st.info(translated)
                     
-                    st.subheader("Bilingual Inscription")
-                    st.text(bilingual)
+                        st.subheader("Bilingual Inscription")
+                        st.text(bilingual)
+                        st.caption(f"Line cache: {line_stats['hit_rate']:.0%} hit rate, "
+                                   f"{line_stats['seconds_saved'] * 1000:.1f} ms saved")
                     
-                    # Show translation pairs
-                    st.subheader("Translation Dictionary")
-                    st.json(st.session_state.translator.translation_models[lang_name][:10])
+                        # Show translation pairs
+                        st.subheader("Translation Dictionary")
+                        st.json(dictionary_sample)
 
-with tab4:
-    st.header("Create Language Families")
+    with tab4:
+        st.header("Create Language Families")
     
-    col1, col2 = st.columns(2)
+        col1, col2 = st.columns(2)
     
-    with col1:
-        base_name = st.text_input("Base Language Name", "Ancient")
-        num_languages = st.slider("Number of related languages", 2, 5, 3)
-        create_family_btn = st.button("Create Language Family", type="primary")
+        with col1:
+            base_name = st.text_input("Base Language Name", "Ancient")
+            num_languages = st.slider("Number of related languages", 2, 5, 3)
+            create_family_btn = st.button("Create Language Family", type="primary")
     
-    if create_family_btn:
-        with st.spinner("Evolving linguistic roots..."):
-            family = st.session_state.language_gen.create_language_family(base_name, num_languages)
-            st.session_state.language_family = family
+        if create_family_btn:
+            with st.spinner("Evolving linguistic roots..."):
+                family = st.session_state.language_gen.create_language_family(base_name, num_languages)
+                st.session_state.language_family = family
             
-            with col2:
-                st.subheader(f"{base_name} Language Family")
+                with col2:
+                    st.subheader(f"{base_name} Language Family")
                 
-                for lang_name, lang_data in family.items():
-                    with st.expander(f"🌐 {lang_name}"):
-                        st.write(f"**Grammar:** {lang_data['grammar_type']}")
-                        st.write(f"**Writing:** {lang_data['script']}")
+                    for lang_name, lang_data in family.items():
+                        with st.expander(f"🌐 {lang_name}"):
+                            st.write(f"**Grammar:** {lang_data['grammar_type']}")
+                            st.write(f"**Writing:** {lang_data['script']}")
                         
-                        # Show a sample sentence
-                        example = st.session_state.language_gen.generate_sentence(lang_name)
-                        st.write(f"**Example:** {example}")
+                            # Show a sample sentence
+                            example = st.session_state.language_gen.generate_sentence(lang_name)
+                            st.write(f"**Example:** {example}")
                         
-                        # Show vocabulary differences
-                        st.write("**Sample Vocabulary:**")
-                        sample_words = dict(list(lang_data['vocabulary'].items())[:5])
-                        st.json(sample_words)
-
-# Sidebar with info and controls
-with st.sidebar:
-    st.header("⚙️ Parameters & Controls")
+                            # Show vocabulary differences
+                            st.write("**Sample Vocabulary:**")
+                            sample_words = dict(islice(lang_data['vocabulary'].items(), 5))
+                            st.json(sample_words)
+
+    # Sidebar with info and controls
+    with st.sidebar:
+        st.header("⚙️ Parameters & Controls")
     
-    st.subheader("Model Parameters")
-    temperature = st.slider("Creativity Temperature", 0.1, 2.0, 0.9, 0.1)
-    max_length = st.slider("Max Generation Length", 50, 200, 100, 10)
+        st.subheader("Model Parameters")
+        temperature = st.slider("Creativity Temperature", 0.1, 2.0, 0.9, 0.1)
+        max_length = st.slider("Max Generation Length", 50, 200, 100, 10)
+    
+        st.subheader("Shared Languages")
+        registry_stats = shared_languages.stats()
+        st.caption(
+            f"{registry_stats['languages']} languages shared by "
+            f"{registry_stats['references']} session references "
+            f"({registry_stats['idle']} idle), "
+            f"{registry_stats['vocabulary_bytes'] / 1e6:.2f} MB of vocabulary"
+        )
+    
+        with st.expander("Performance"):
+            instrument = st.checkbox("Time generator calls", value=instrumentation.is_enabled(),
+                                     help="Applies to every session served by this process")
+            if instrument and not instrumentation.is_enabled():
+                instrumentation.enable()
+            elif not instrument and instrumentation.is_enabled():
+                instrumentation.disable()
+
+            perf_stats = instrumentation.get_stats()
+            if perf_stats:
+                st.table([
+                    {"method": name, "calls": row["count"], "p50 ms": round(row["p50_ms"], 3),
+                     "p99 ms": round(row["p99_ms"], 3), "total ms": round(row["total_ms"], 1),
+                     "bytes": row["bytes_produced"]}
+                    for name, row in perf_stats.items()
+                ])
+                st.download_button("Download stats (JSON)", instrumentation.dump_json(),
+                                   file_name="linguistic_alchemy_stats.json", mime="application/json")
+                if st.button("Reset stats"):
+                    instrumentation.reset()
+        
+            if st.button("Profile next rerun"):
+                st.session_state.profile_next_rerun = True
+            last_capture = st.session_state.get('last_capture')
+            if last_capture is not None:
+                st.caption(f"Last profiled rerun peaked at {last_capture.peak_bytes / 1e6:.2f} MB traced")
+                st.code(last_capture.profile_text)
+                st.code("\n".join(last_capture.top_allocations))
     
-    st.subheader("App Info")
-    st.info("""
-    **Linguistic Alchemy** uses advanced NLP techniques
-    to generate fictional languages, runic scripts,
-    and magical lore for game development.
-    """)
+        st.subheader("App Info")
+        st.info("""
+        **Linguistic Alchemy** uses advanced NLP techniques
+        to generate fictional languages, runic scripts,
+        and magical lore for game development.
+        """)
     
-    if st.button("Clear Session"):
-        st.session_state.clear()
-        st.rerun()
+        if st.button("Clear Session"):
+            st.session_state.clear()
+            st.rerun()
 
-# Footer
-st.markdown("---")
-st.caption("Built with Streamlit • Linguistic Alchemy v1.0 • For Game Development")
\ No newline at end of file
+    # Footer
+    st.markdown("---")
+    st.caption("Built with Streamlit • Linguistic Alchemy v1.0 • For Game Development")
+finally:
+    # Keep the result so the sidebar shows it on the next rerun
+    if rerun_capture is not None:
+        st.session_state.last_capture = rerun_capture.stop()
@@ -0,0 +1,202 @@
+"""Headless batch pipeline: read JSONL jobs, stream JSONL results.
+
+Each input line is one job object with a "type" of create_language,
+translate, inscription, runes, sigil, lore or family. Results are written to stdout in
+input order, one JSON object per line, so a run is reproducible regardless
+of the number of workers. Jobs without a "seed" get one derived from the
+run seed and the job's line number.
+
+Examples:
+
+    python cli.py jobs.jsonl --workers 4 > results.jsonl
+    cat jobs.jsonl | python cli.py - --seed 7
+
+    {"type": "create_language", "name": "Elvish", "family": "elvish", "seed": 3}
+    {"type": "create_language", "name": "Deep", "family": "dwarvish", "phonotactic": true}
+    {"type": "translate", "language": {"name": "Elvish", "seed": 3}, "text": "the sky is dark"}
+    {"type": "inscription", "language": {"name": "Elvish", "seed": 3}, "lines": ["the sky"], "template": "trilingual"}
+    {"type": "runes", "text": "Magic is real", "script_type": "geometric", "diameter": 9}
+    {"type": "sigil", "text": "Protect this treasure"}
+    {"type": "lore", "runes": "ᚠᚢᚠ", "intent": "wealth"}
+    {"type": "lore", "language": {"name": "Elvish", "seed": 3}}
+    {"type": "family", "base_name": "Ancient", "num_languages": 4}
+"""
+import argparse
+import json
+import sys
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterator, Tuple
+
+from language_generator import AncientLanguageGenerator
+from lore_generator import LoreGenerator
+from rune_maker import RuneGenerator
+from translator import LinguisticTranslator
+
+DEFAULT_ENGLISH_WORDS = ["sky", "earth", "fire", "water", "light",
+                         "dark", "life", "death", "beautiful", "today"]
+
+
+def _language_record(language: Dict) -> Dict:
+    record = dict(language)
+    record["vocabulary"] = dict(language["vocabulary"].items())
+    record["morphology"] = dict(language["morphology"])
+    return record
+
+
+@lru_cache(maxsize=64)
+def _build_language(name: str, family: str, seed, word_count, phonotactic):
+    """Generate (and keep per worker) the language a job refers to"""
+    generator = AncientLanguageGenerator(seed)
+    language = generator.generate_language(name, family, word_count=word_count, phonotactic=phonotactic)
+    return generator, language, generator.rng.getstate()
+
+
+def _resolve_language(spec: Dict, seed) -> Tuple[AncientLanguageGenerator, Dict]:
+    generator, language, state = _build_language(spec["name"], spec.get("family", "elvish"),
+                                                 spec.get("seed", seed), spec.get("word_count"),
+                                                 spec.get("phonotactic", False))
+    # Rewind so a cached language behaves as if freshly generated, whichever
+    # worker (and whichever earlier jobs) it landed on
+    generator.rng.setstate(state)
+    return generator, language
+
+
+def _create_language(job, seed):
+    generator, language = _resolve_language(job, seed)
+    record = _language_record(language)
+    if job.get("sentences"):
+        record["sentences"] = generator.generate_sentences(language["name"], job["sentences"])
+    return record
+
+
+def _translate(job, seed):
+    generator, language = _resolve_language(job["language"], seed)
+    translator = LinguisticTranslator(generator)
+    translator.create_translation_system(language["name"], job.get("english", DEFAULT_ENGLISH_WORDS))
+    if "texts" in job:
+        return {"translations": translator.translate_many(job["texts"], language["name"])}
+    return {"translation": translator.translate_to_ancient(job["text"], language["name"])}
+
+
+def _inscription(job, seed):
+    generator, language = _resolve_language(job["language"], seed)
+    translator = LinguisticTranslator(generator)
+    translator.create_translation_system(language["name"], job.get("english", DEFAULT_ENGLISH_WORDS))
+    pipeline = translator.inscription_pipeline(language["name"], job.get("script_type", "runic"),
+                                               job.get("template", "inscription"))
+    return {"inscriptions": pipeline.render_many(job["lines"])}
+
+
+def _runes(job, seed):
+    rune_gen = RuneGenerator(seed)
+    result = {"runes": rune_gen.generate_rune_script(job["text"], job.get("script_type", "runic"))}
+    if job.get("diameter"):
+        result["circle"] = rune_gen.generate_rune_circle(job["text"], job["diameter"])
+    return result
+
+
+def _sigil(job, seed):
+    return {"sigil": RuneGenerator(seed).generate_magic_sigil(job["text"])}
+
+
+def _lore(job, seed):
+    lore_gen = LoreGenerator(seed)
+    if "language" in job:
+        _, language = _resolve_language(job["language"], seed)
+        return {"lore": lore_gen.generate_language_lore(language)}
+    return {"lore": lore_gen.generate_rune_lore(job["runes"], job.get("intent", ""))}
+
+
+def _family(job, seed):
+    generator = AncientLanguageGenerator(job.get("seed", seed))
+    family = generator.create_language_family(job["base_name"], job.get("num_languages", 3))
+    return {"languages": {name: _language_record(language) for name, language in family.items()}}
+
+
+JOB_HANDLERS = {
+    "create_language": _create_language,
+    "translate": _translate,
+    "inscription": _inscription,
+    "runes": _runes,
+    "sigil": _sigil,
+    "lore": _lore,
+    "family": _family,
+}
+
+
+def run_job(index: int, line: str, run_seed: int) -> str:
+    """Execute one JSONL job and return its JSONL result line"""
+    job_id = index
+    try:
+        job = json.loads(line)
+        job_id = job.get("id", index)
+        handler = JOB_HANDLERS.get(job.get("type"))
+        if handler is None:
+            raise ValueError(f"Unknown job type {job.get('type')!r}")
+        # String seeds hash deterministically, independent of PYTHONHASHSEED
+        seed = job.get("seed", f"{run_seed}:{index}")
+        result = {"id": job_id, "type": job["type"], "result": handler(job, seed)}
+    except Exception as error:  # report and keep the batch going
+        result = {"id": job_id, "error": f"{type(error).__name__}: {error}"}
+    return json.dumps(result, ensure_ascii=False)
+
+
+def _read_jobs(stream) -> Iterator[Tuple[int, str]]:
+    for index, line in enumerate(stream):
+        if line.strip():
+            yield index, line
+
+
+def run_pipeline(stream, output, workers: int = 1, max_in_flight: int = 64, run_seed: int = 0) -> int:
+    """Stream jobs from `stream` to `output`, returning the number of jobs processed"""
+    jobs = _read_jobs(stream)
+    processed = 0
+
+    if workers <= 1:
+        for index, line in jobs:
+            output.write(run_job(index, line, run_seed) + "\n")
+            processed += 1
+        return processed
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # At most `max_in_flight` jobs are queued; input is only read as results
+    # are written, which keeps memory bounded and preserves input order
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque(
+            pool.submit(run_job, index, line, run_seed) for index, line in islice(jobs, max_in_flight)
+        )
+        while pending:
+            output.write(pending.popleft().result() + "\n")
+            output.flush()
+            processed += 1
+            for index, line in islice(jobs, 1):
+                pending.append(pool.submit(run_job, index, line, run_seed))
+    return processed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("jobs", nargs="?", default="-", help="JSONL job file, or - for stdin")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default 1: inline)")
+    parser.add_argument("--max-in-flight", type=int, default=64, help="jobs queued ahead of the output")
+    parser.add_argument("--seed", type=int, default=0, help="run seed for jobs without their own")
+    args = parser.parse_args(argv)
+
+    if args.jobs == "-":
+        stream = sys.stdin
+    else:
+        stream = open(args.jobs, encoding="utf-8")
+    try:
+        count = run_pipeline(stream, sys.stdout, args.workers, max(1, args.max_in_flight), args.seed)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    print(f"{count} jobs processed", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""Stream an English lexicon into a translation dictionary for a generated language.
+
+The lexicon is read one line at a time (`word<TAB>part-of-speech`, the tag
+being optional). Each English entry is paired with an unused generated word
+of the same category, and the language's vocabulary is extended when a
+category runs dry. Pairs are packed into flat buffers as they are made, and
+the finished TranslationDictionary can be saved and memory-mapped back later
+without rebuilding.
+"""
+import json
+import mmap
+import os
+import random
+import struct
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from vocabulary import LazyVocabulary, Vocabulary
+
+# File layout (little-endian, sections padded to 8 bytes):
+#   magic | header | metadata JSON | English offsets (uint32) | category codes (uint8)
+#   | table (int32) | ancient offsets (uint32) | English words | ancient words (UTF-8)
+MAGIC = b"LADICT01"
+_HEADER = struct.Struct("<QQQQQ")  # metadata bytes, pairs, table slots, English bytes, ancient bytes
+DICTIONARY_FILE_SUFFIX = ".dict"
+
+PathLike = Union[str, os.PathLike]
+
+# Lexicon part-of-speech tags (plain names, WordNet letters, Penn Treebank tags)
+POS_TAGS = {
+    "noun": "noun", "n": "noun", "nn": "noun", "nns": "noun", "nnp": "noun", "nnps": "noun",
+    "verb": "verb", "v": "verb", "vb": "verb", "vbd": "verb", "vbg": "verb",
+    "vbn": "verb", "vbp": "verb", "vbz": "verb",
+    "adjective": "adjective", "adj": "adjective", "a": "adjective", "s": "adjective",
+    "jj": "adjective", "jjr": "adjective", "jjs": "adjective",
+    "adverb": "adverb", "adv": "adverb", "r": "adverb", "rb": "adverb", "rbr": "adverb", "rbs": "adverb",
+    "preposition": "preposition", "prep": "preposition", "in": "preposition", "p": "preposition",
+}
+
+
+def _padded(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def read_lexicon(source) -> Iterator[Tuple[str, Optional[str]]]:
+    """Yield (word, category) from a lexicon path or open text stream.
+
+    Blank lines and lines starting with '#' are skipped. Entries without a
+    tag are nouns; entries with an unknown tag come through as (word, None).
+    """
+    stream = open(source, encoding="utf-8") if isinstance(source, (str, os.PathLike)) else source
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            word, _, tag = line.partition("\t")
+            category = POS_TAGS.get(tag.strip().lower()) if tag else "noun"
+            yield word.strip().lower(), category
+    finally:
+        if stream is not source:
+            stream.close()
+
+
+class TranslationDictionary(Sequence):
+    """English -> ancient word pairs in packed buffers.
+
+    Acts as the pair list of a translation model (indexing and slicing give
+    (english, ancient) tuples) and as its lookup index. Lookups match whole
+    English words through the hash table of the English side.
+    """
+
+    def __init__(self, language_name: str, english: Vocabulary, ancient_words, ancient_offsets):
+        self.language_name = language_name
+        # English word -> category; entry i pairs with ancient word i
+        self.english = english
+        self._ancient_words = ancient_words
+        self._ancient_offsets = ancient_offsets
+
+    def _ancient(self, index: int) -> str:
+        offsets = self._ancient_offsets
+        return str(self._ancient_words[offsets[index]:offsets[index + 1]], "utf-8")
+
+    def __len__(self) -> int:
+        return len(self._ancient_offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.english.word_at(index), self._ancient(index)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        for index in range(len(self)):
+            yield self.english.word_at(index), self._ancient(index)
+
+    def __repr__(self) -> str:
+        return f"TranslationDictionary({self.language_name!r}, {len(self)} pairs)"
+
+    # Translation index interface, see translator.TranslationIndex
+
+    def is_stale(self, pairs) -> bool:
+        return pairs is not self
+
+    def lookup_exact(self, word: str) -> Optional[str]:
+        try:
+            return self._ancient(self.english.position(word))
+        except KeyError:
+            return None
+
+    lookup = lookup_exact
+
+    def category(self, word: str) -> str:
+        """Part of speech of an English entry"""
+        return self.english[word]
+
+    def memory_usage(self) -> int:
+        return (self.english.memory_usage() + len(self._ancient_words)
+                + self._ancient_offsets.itemsize * len(self._ancient_offsets))
+
+    def save(self, path: PathLike):
+        """Write the dictionary in the compact binary format"""
+        words, offsets, codes, table = self.english.packed_buffers()
+        meta = json.dumps({"language": self.language_name,
+                           "categories": self.english.categories}).encode("utf-8")
+        sections = [meta, offsets.tobytes(), codes.tobytes(), table.tobytes(),
+                    self._ancient_offsets.tobytes(), bytes(words), bytes(self._ancient_words)]
+        with open(path, "wb") as handle:
+            handle.write(MAGIC)
+            handle.write(_HEADER.pack(len(meta), len(codes), len(table), len(words), len(self._ancient_words)))
+            for section in sections:
+                handle.write(section)
+                handle.write(b"\0" * (_padded(len(section)) - len(section)))
+
+    @classmethod
+    def load(cls, path: PathLike) -> "TranslationDictionary":
+        """Map a saved dictionary into memory; pages are read on demand"""
+        with open(path, "rb") as handle:
+            if handle.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a dictionary file")
+            meta_size, count, table_slots, english_size, ancient_size = _HEADER.unpack(handle.read(_HEADER.size))
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(mapped)
+        position = len(MAGIC) + _HEADER.size
+        metadata = json.loads(bytes(view[position:position + meta_size]))
+        position += _padded(meta_size)
+
+        sections = []
+        for size, fmt in (((count + 1) * 4, "I"), (count, "B"), (table_slots * 4, "i"),
+                          ((count + 1) * 4, "I"), (english_size, "B"), (ancient_size, "B")):
+            sections.append(view[position:position + size].cast(fmt))
+            position += _padded(size)
+        offsets, codes, table, ancient_offsets, words, ancient_words = sections
+
+        english = Vocabulary.from_buffers(words, offsets, codes, table, metadata["categories"])
+        return cls(metadata["language"], english.freeze(), ancient_words, ancient_offsets)
+
+
+class DictionaryBuilder:
+    """Pair streamed English entries with generated words of the same category"""
+
+    # Smallest number of words added when the language runs short
+    GROWTH_BATCH = 4096
+
+    def __init__(self, language_generator, language_name: str, seed=None):
+        if language_name not in language_generator.languages:
+            raise ValueError(f"Language {language_name} not found")
+        self.lg = language_generator
+        self.language_name = language_name
+        # Growth seeds come from here, so a build is reproducible for a given seed
+        self.rng = random.Random(seed) if seed is not None else language_generator.rng
+
+        self.english = Vocabulary()
+        self._ancient_words = bytearray()
+        self._ancient_offsets = array("I", [0])
+        self.skipped = 0
+        self.grown = 0
+
+        vocabulary = language_generator.languages[language_name]["vocabulary"]
+        # Generated words not yet paired, per category, filled from a single
+        # pass over the vocabulary and then from growth batches
+        self._unused: Dict[str, deque] = {}
+        self._source = iter(vocabulary.items())
+        self._growable = not isinstance(vocabulary, LazyVocabulary)
+
+    def _next_word(self, category: str) -> str:
+        queue = self._unused.setdefault(category, deque())
+        while not queue:
+            item = next(self._source, None)
+            if item is None:
+                self._grow()
+                continue
+            word, word_category = item
+            self._unused.setdefault(word_category, deque()).append(word)
+        return queue.popleft()
+
+    def _grow(self):
+        if not self._growable:
+            raise ValueError(f"{self.language_name} has a fixed-size lazy vocabulary and ran out of words")
+        # Grow by as many words as were paired so far, so the number of
+        # growth rounds stays logarithmic in the lexicon size
+        count = max(self.GROWTH_BATCH, len(self.english))
+        added = self.lg.extend_vocabulary(self.language_name, count, seed=self.rng.getrandbits(64))
+        self.grown += len(added)
+        self._source = iter(added.items())
+
+    def add(self, english: str, category: Optional[str]) -> Optional[str]:
+        """Pair one English word and return its ancient word; repeated entries keep the first pair"""
+        if category is None:
+            self.skipped += 1
+            return None
+        if english in self.english:
+            return self._ancient_at(self.english.position(english))
+
+        ancient = self._next_word(category)
+        self.english[english] = category
+        data = ancient.encode("utf-8")
+        self._ancient_words += data
+        self._ancient_offsets.append(len(self._ancient_words))
+        return ancient
+
+    def _ancient_at(self, index: int) -> str:
+        offsets = self._ancient_offsets
+        return str(self._ancient_words[offsets[index]:offsets[index + 1]], "utf-8")
+
+    def feed(self, entries: Iterable[Tuple[str, Optional[str]]]) -> "DictionaryBuilder":
+        for english, category in entries:
+            self.add(english, category)
+        return self
+
+    def build(self) -> TranslationDictionary:
+        return TranslationDictionary(self.language_name, self.english,
+                                     self._ancient_words, self._ancient_offsets)
+
+
+def build_dictionary(language_generator, language_name: str, lexicon, path: PathLike = None,
+                     seed=None) -> TranslationDictionary:
+    """Stream `lexicon` (a path or text stream) into a dictionary, saving it to `path` if given"""
+    dictionary = DictionaryBuilder(language_generator, language_name, seed).feed(read_lexicon(lexicon)).build()
+    if path is not None:
+        if os.path.isdir(path):
+            path = os.path.join(path, language_name + DICTIONARY_FILE_SUFFIX)
+        dictionary.save(path)
+    return dictionary
@@ -0,0 +1,225 @@
+"""Phylogenetic language trees driven by ordered sound changes.
+
+Each node of a tree is its parent language after a few sound-change rules,
+picked deterministically from the tree seed and the node's path. A rule is
+one compiled regex applied to the whole vocabulary at once: the words are
+joined with newlines, rewritten by `re.sub` in a single C-level pass, and
+split again. Children store only the words that changed, as an
+OverlayVocabulary over their parent, and nodes are materialized only when
+asked for (together with any ancestors not built yet).
+"""
+import random
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple, Union
+
+from vocabulary import LazyVocabulary, OverlayVocabulary
+
+# Ordered sound-change catalogue: (name, pattern, replacement). Patterns run
+# over newline-joined words in MULTILINE mode, so ^ and $ are word edges and
+# character classes exclude the newline.
+SOUND_CHANGES = [
+    ("x-cluster", r"x", "ks"),
+    ("th-fronting", r"th", "f"),
+    ("palatalization", r"k(?=[ei])", "ch"),
+    ("g-palatalization", r"g(?=[ei])", "j"),
+    ("p-lenition", r"(?<=[aeiou])p(?=[aeiou])", "v"),
+    ("t-lenition", r"(?<=[aeiou])t(?=[aeiou])", "d"),
+    ("k-lenition", r"(?<=[aeiou])k(?=[aeiou])", "g"),
+    ("rhotacism", r"(?<=[aeiou])s(?=[aeiou])", "r"),
+    ("nasal-assimilation", r"n(?=[pb])", "m"),
+    ("degemination", r"([bcdfgklmnprstvz])\1", r"\1"),
+    ("ae-monophthongization", r"ae", "e"),
+    ("ie-monophthongization", r"ie", "i"),
+    ("a-raising", r"a(?=[^aeiou\n-][ie])", "e"),
+    ("o-raising", r"o(?=[mn])", "u"),
+    ("u-fronting", r"u(?=[^aeiou\n-]?i)", "y"),
+    ("l-vocalization", r"(?<=[aeiou])l(?=[^aeiou\n-])", "u"),
+    ("z-devoicing", r"z", "s"),
+    ("final-devoicing-d", r"d$", "t"),
+    ("final-devoicing-g", r"g$", "k"),
+    ("syncope", r"(?<=[^aeiou\n-][aeiou][^aeiou\n-])e(?=[^aeiou\n-][aeiou])", ""),
+    ("apocope", r"(?<=[^aeiou\n-][aeiou][^aeiou\n-])[eo]$", ""),
+    ("s-prothesis", r"^(?=s[ptk])", "e"),
+]
+
+
+@lru_cache(maxsize=1)
+def _compiled_changes() -> Tuple[Tuple[str, re.Pattern, str], ...]:
+    # Compiled on first use rather than at import
+    return tuple((name, re.compile(pattern, re.MULTILINE), replacement)
+                 for name, pattern, replacement in SOUND_CHANGES)
+
+
+# Path of a node: child numbers from the root, () being the root itself
+Path = Tuple[int, ...]
+
+
+def apply_sound_changes(words: Sequence[str], rules: Sequence[str]) -> List[str]:
+    """Apply the named rules, in catalogue order, to a whole word list at once"""
+    selected = set(rules)
+    text = "\n".join(words)
+    for name, pattern, replacement in _compiled_changes():
+        if name in selected:
+            text = pattern.sub(replacement, text)
+    return text.split("\n")
+
+
+class LanguageTree:
+    """A lazily built family tree evolving from one proto-language.
+
+    `branching` gives the number of children per node at each level, so
+    (4, 5, 6) describes 4 branches of 5 sub-branches of 6 dialects each.
+    """
+
+    # Sound changes each node adds on top of its parent
+    MIN_RULES = 2
+    MAX_RULES = 4
+    # Chance that a node also changes its word order
+    GRAMMAR_DRIFT = 0.3
+
+    def __init__(self, language_generator, root_name: str, branching: Union[int, Sequence[int]] = (3, 3, 3),
+                 seed=None, register: bool = True):
+        if root_name not in language_generator.languages:
+            raise ValueError(f"Language {root_name} not found")
+        if isinstance(language_generator.languages[root_name]["vocabulary"], LazyVocabulary):
+            raise TypeError(f"{root_name} has a lazy vocabulary; sound changes need a stored one")
+        self.lg = language_generator
+        self.root_name = root_name
+        self.branching = (branching,) if isinstance(branching, int) else tuple(branching)
+        self.seed = seed
+        # Materialized nodes are also added to the generator's languages
+        self.register = register
+
+        self._nodes: Dict[Path, Dict] = {(): language_generator.languages[root_name]}
+        # Word lists of the nodes that have children, all aligned with the
+        # root's, so word i of any node shares the root's category i
+        self._lexicons: Dict[Path, List[str]] = {}
+        self._categories: List[str] = []
+        # level -> {"nodes", "seconds", "changed_words", "delta_bytes"}
+        self._levels: Dict[int, Dict[str, float]] = {}
+
+    @property
+    def depth(self) -> int:
+        return len(self.branching)
+
+    def size(self) -> int:
+        """Number of nodes in the full tree, the root included"""
+        total = count = 1
+        for width in self.branching:
+            count *= width
+            total += count
+        return total
+
+    def name_of(self, path: Path) -> str:
+        return ".".join([self.root_name] + [str(step + 1) for step in path])
+
+    def paths_at(self, level: int) -> List[Path]:
+        """Every node path at one level of the tree"""
+        paths = [()]
+        for width in self.branching[:level]:
+            paths = [path + (child,) for path in paths for child in range(width)]
+        return paths
+
+    def _check(self, path: Path):
+        if len(path) > self.depth or any(
+                not 0 <= step < width for step, width in zip(path, self.branching)):
+            raise KeyError(f"No node {path} in a tree branching {self.branching}")
+
+    def is_materialized(self, path: Path) -> bool:
+        return tuple(path) in self._nodes
+
+    def rules_for(self, path: Path) -> List[str]:
+        """The sound changes separating a node from its parent, in the order they apply"""
+        path = tuple(path)
+        if not path:
+            return []
+        rng = random.Random(f"{self.seed}:{path}")
+        picked = set(rng.sample(range(len(SOUND_CHANGES)), rng.randint(self.MIN_RULES, self.MAX_RULES)))
+        return [SOUND_CHANGES[i][0] for i in sorted(picked)]
+
+    def language(self, path: Path = ()) -> Dict:
+        """Return a node, building it and any missing ancestors"""
+        path = tuple(path)
+        self._check(path)
+        node = self._nodes.get(path)
+        if node is None:
+            node = self._derive(path, self.language(path[:-1]))
+        return node
+
+    def _lexicon(self, path: Path) -> List[str]:
+        words = self._lexicons.get(path)
+        if words is None:
+            # Only the root is read from its vocabulary; derived parents
+            # always keep their word list
+            items = list(self._nodes[()]["vocabulary"].items())
+            words = [word for word, _ in items]
+            self._categories = [category for _, category in items]
+            self._lexicons[()] = words
+        return words
+
+    def _derive(self, path: Path, parent: Dict) -> Dict:
+        start = time.perf_counter()
+        rules = self.rules_for(path)
+        words = self._lexicon(path[:-1])
+        evolved = apply_sound_changes(words, rules)
+        changed = [i for i, (old, new) in enumerate(zip(words, evolved)) if new != old]
+
+        # A change that would merge two words is blocked (homophony
+        # avoidance); only the words that did change are stored
+        taken = set(words).difference([words[i] for i in changed])
+        added: Dict[str, str] = {}
+        removed = set()
+        for i in changed:
+            old, new = words[i], evolved[i]
+            if not new or new in taken:
+                new = old
+            while new in taken:
+                new += "'"
+            taken.add(new)
+            evolved[i] = new
+            if new != old:
+                added[new] = self._categories[i]
+                removed.add(old)
+        if len(path) < self.depth:
+            self._lexicons[path] = evolved
+
+        node = dict(parent)
+        node["name"] = self.name_of(path)
+        node["vocabulary"] = OverlayVocabulary(parent["vocabulary"], added, removed)
+        node["sound_changes"] = rules
+        rng = random.Random(f"{self.seed}:{path}:grammar")
+        if rng.random() < self.GRAMMAR_DRIFT:
+            node["grammar_type"] = rng.choice(["SVO", "SOV", "VSO"])
+
+        self._nodes[path] = node
+        if self.register:
+            self.lg.languages[node["name"]] = node
+
+        level = self._levels.setdefault(
+            len(path), {"nodes": 0, "seconds": 0.0, "changed_words": 0, "delta_bytes": 0})
+        level["nodes"] += 1
+        level["seconds"] += time.perf_counter() - start
+        level["changed_words"] += len(added)
+        level["delta_bytes"] += (sys.getsizeof(added) + sys.getsizeof(removed)
+                                 + sum(sys.getsizeof(word) for word in added)
+                                 + sum(sys.getsizeof(word) for word in removed))
+        return node
+
+    def build_level(self, level: int) -> Dict[str, float]:
+        """Materialize every node of one level and return that level's report"""
+        if not 0 <= level <= self.depth:
+            raise ValueError(f"Level must be between 0 and {self.depth}")
+        for path in self.paths_at(level):
+            self.language(path)
+        return self.report()[level] if level else {"level": 0, "nodes": 1, "seconds": 0.0,
+                                                     "changed_words": 0, "delta_bytes": 0}
+
+    def report(self) -> Dict[int, Dict[str, float]]:
+        """Build time and vocabulary delta memory per level, over the nodes built so far"""
+        return {level: dict(stats, level=level) for level, stats in sorted(self._levels.items())}
+
+    def leaves(self) -> List[Path]:
+        return self.paths_at(self.depth)
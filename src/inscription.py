@@ -0,0 +1,162 @@
+"""Fused tokenize -> translate -> runify -> format pipeline for inscription sheets.
+
+A pipeline is built once per language, script and layout. Each line is
+handled in a single pass: its words are split, looked up in the translation
+index and converted to runes together, with the result for every distinct
+word memoized, and then formatted. Lines can be rendered one at a time, as a
+batch, or streamed from a file, so whole books go through in constant memory.
+
+IncrementalTranslator re-translates an edited document by reusing the
+results of every line it has already seen, which keeps live previews of long
+texts cheap.
+"""
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Tuple, Union
+
+from rune_maker import RuneGenerator
+
+# Layouts for one line of text; {language} is the language's name
+INSCRIPTION_TEMPLATES = {
+    # The block LinguisticTranslator.create_bilingual_inscription returns
+    "inscription": "\nEnglish: {english}\n{language}: {ancient}\nRunic: {runic}\n        ",
+    "bilingual": "{english}\n{ancient}\n\n",
+    "trilingual": "{english}\n{ancient}\n{runic}\n\n",
+    "tsv": "{english}\t{ancient}\t{runic}\n",
+}
+
+
+class InscriptionPipeline:
+    """Turn English lines into formatted English / ancient / runic inscriptions"""
+
+    # Distinct words remembered before the memo starts over, bounding memory
+    MEMO_SIZE = 1 << 16
+
+    def __init__(self, index, language_name: str, script_type: str = "runic",
+                 template: str = "inscription"):
+        # Anything with lookup(word), e.g. a TranslationIndex or TranslationDictionary
+        self.index = index
+        self.language_name = language_name
+        self.script_type = script_type
+        # A layout name from INSCRIPTION_TEMPLATES or a format string of its own
+        self.template = INSCRIPTION_TEMPLATES.get(template, template)
+        self._rune_gen = RuneGenerator()
+        # English word -> (ancient word, runes)
+        self._memo: Dict[str, Tuple[str, str]] = {}
+
+    def _resolve(self, word: str) -> Tuple[str, str]:
+        ancient = self.index.lookup(word)
+        if ancient is None:
+            ancient = word  # Keep untranslated
+        entry = (ancient, self._rune_gen.generate_rune_script(ancient, self.script_type))
+        if len(self._memo) >= self.MEMO_SIZE:
+            self._memo.clear()
+        self._memo[word] = entry
+        return entry
+
+    def translate_line(self, text: str) -> Tuple[str, str]:
+        """Ancient and runic text of one line of English"""
+        memo = self._memo
+        ancient_words = []
+        runic_words = []
+        for word in text.lower().split():
+            entry = memo.get(word) or self._resolve(word)
+            ancient_words.append(entry[0])
+            runic_words.append(entry[1])
+        return " ".join(ancient_words), " ".join(runic_words)
+
+    def format(self, english: str, ancient: str, runic: str) -> str:
+        return self.template.format(english=english, language=self.language_name,
+                                    ancient=ancient, runic=runic)
+
+    def render(self, text: str) -> str:
+        """Render one line of English text"""
+        return self.format(text, *self.translate_line(text))
+
+    def render_many(self, lines: Iterable[str]) -> List[str]:
+        """Render a batch of lines"""
+        return [self.render(line) for line in lines]
+
+    def stream(self, source: Union[str, os.PathLike, Iterable[str]]) -> Iterator[str]:
+        """Render a file path or an iterable of lines, yielding one inscription per line"""
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, encoding="utf-8") as handle:
+                for line in handle:
+                    yield self.render(line.rstrip("\r\n"))
+        else:
+            for line in source:
+                yield self.render(line.rstrip("\r\n"))
+
+    def write(self, source: Union[str, os.PathLike, Iterable[str]],
+              destination: Union[str, os.PathLike]) -> int:
+        """Stream an inscription sheet into a file and return the number of lines rendered"""
+        count = 0
+        with open(destination, "w", encoding="utf-8") as handle:
+            for inscription in self.stream(source):
+                handle.write(inscription)
+                count += 1
+        return count
+
+
+class IncrementalTranslator:
+    """Translate a document that is edited between calls, redoing only new lines.
+
+    Each line's ancient and runic text is cached under its content (the cache
+    belongs to one pipeline, so to one language and script). An update looks
+    every line up, translates only the misses and joins the results, giving
+    exactly what translating the whole text at once would.
+    """
+
+    # Distinct lines kept, least recently used dropped first
+    CACHE_LINES = 1 << 14
+
+    def __init__(self, pipeline: InscriptionPipeline, cache_lines: int = CACHE_LINES):
+        self.pipeline = pipeline
+        self.cache_lines = cache_lines
+        # line -> (ancient, runic, seconds it took to translate)
+        self._lines: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()
+        self.hits = self.misses = 0
+        self.seconds_spent = self.seconds_saved = 0.0
+
+    def update(self, text: str) -> Tuple[str, str]:
+        """Ancient and runic text of a whole document"""
+        cache = self._lines
+        ancient_parts, runic_parts = [], []
+        for line in text.split("\n"):
+            entry = cache.get(line)
+            if entry is None:
+                start = time.perf_counter()
+                ancient, runic = self.pipeline.translate_line(line)
+                entry = cache[line] = (ancient, runic, time.perf_counter() - start)
+                self.misses += 1
+                self.seconds_spent += entry[2]
+                if len(cache) > self.cache_lines:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(line)
+                self.hits += 1
+                self.seconds_saved += entry[2]
+            # Blank lines have no words, as in a whole-text translation
+            if entry[0]:
+                ancient_parts.append(entry[0])
+                runic_parts.append(entry[1])
+        return " ".join(ancient_parts), " ".join(runic_parts)
+
+    def translate(self, text: str) -> str:
+        return self.update(text)[0]
+
+    def render(self, text: str) -> str:
+        """The pipeline's layout filled in for the whole document"""
+        return self.pipeline.format(text, *self.update(text))
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "seconds_spent": self.seconds_spent,
+            "seconds_saved": self.seconds_saved,
+            "cached_lines": len(self._lines),
+        }
@@ -0,0 +1,198 @@
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import deque
+from functools import wraps
+from typing import Dict, List, Optional
+
+from language_generator import AncientLanguageGenerator
+from lore_generator import LoreGenerator
+from rune_maker import RuneGenerator
+from translator import LinguisticTranslator
+
+# Classes whose public methods are timed while instrumentation is enabled
+INSTRUMENTED_CLASSES = [AncientLanguageGenerator, RuneGenerator, LoreGenerator, LinguisticTranslator]
+
+# Durations kept per method for percentiles; older samples are dropped
+SAMPLE_WINDOW = 2048
+
+_lock = threading.Lock()
+_originals: Dict[tuple, object] = {}
+_stats: Dict[str, "MethodStats"] = {}
+# cProfile and tracemalloc are process-wide, so only one Capture runs at a time
+_active_capture: Optional["Capture"] = None
+
+
+class MethodStats:
+    """Call counter and timing window for one instrumented method"""
+    __slots__ = ("count", "total", "bytes_produced", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.bytes_produced = 0
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+
+    def record(self, elapsed: float, produced: int):
+        self.count += 1
+        self.total += elapsed
+        self.bytes_produced += produced
+        self.samples.append(elapsed)
+
+    def summary(self) -> Dict[str, float]:
+        ordered = sorted(self.samples)
+        def percentile(fraction):
+            return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000 if ordered else 0.0
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "p50_ms": percentile(0.50),
+            "p99_ms": percentile(0.99),
+            "bytes_produced": self.bytes_produced,
+        }
+
+
+def _output_size(result) -> int:
+    """UTF-8 size of string output (or of a list of strings); 0 for anything else"""
+    if isinstance(result, str):
+        return len(result.encode("utf-8"))
+    if isinstance(result, list) and result and isinstance(result[0], str):
+        return sum(len(item.encode("utf-8")) for item in result)
+    return 0
+
+
+def _wrap(qualified_name: str, method):
+    @wraps(method)
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        result = method(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        produced = _output_size(result)
+        with _lock:
+            stats = _stats.get(qualified_name)
+            if stats is None:
+                stats = _stats[qualified_name] = MethodStats()
+            stats.record(elapsed, produced)
+        return result
+    return timed
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def enable():
+    """Wrap the public methods of the generator classes with timers.
+
+    Wrapping replaces the class attributes, so it applies process-wide, and
+    disable() puts the originals back, leaving no overhead behind.
+    """
+    with _lock:
+        if _originals:
+            return
+        for cls in INSTRUMENTED_CLASSES:
+            for name, member in list(vars(cls).items()):
+                if name.startswith("_") or not callable(member) or isinstance(
+                        member, (type, staticmethod, classmethod)):
+                    continue
+                _originals[(cls, name)] = member
+                setattr(cls, name, _wrap(f"{cls.__name__}.{name}", member))
+
+
+def disable():
+    """Restore the original, unwrapped methods"""
+    with _lock:
+        for (cls, name), member in _originals.items():
+            setattr(cls, name, member)
+        _originals.clear()
+
+
+def reset():
+    """Forget all collected statistics"""
+    with _lock:
+        _stats.clear()
+
+
+def get_stats() -> Dict[str, Dict[str, float]]:
+    """Aggregated statistics per method, busiest first"""
+    with _lock:
+        summaries = {name: stats.summary() for name, stats in _stats.items()}
+    return dict(sorted(summaries.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+
+def dump_json(path: str = None) -> str:
+    """Serialise the statistics as JSON, optionally writing them to `path`"""
+    payload = json.dumps(get_stats(), indent=2)
+    if path:
+        with open(path, "w") as handle:
+            handle.write(payload)
+    return payload
+
+
+class Capture:
+    """cProfile and/or tracemalloc capture spanning one unit of work, e.g. a rerun.
+
+    Both tools observe the whole process, so a capture started while another
+    one is running would record (and stop) the other's work; start() raises
+    RuntimeError instead.
+    """
+
+    def __init__(self, profile: bool = True, memory: bool = False, top: int = 20):
+        self.profile = profile
+        self.memory = memory
+        self.top = top
+        self.profile_text: Optional[str] = None
+        self.top_allocations: List[str] = []
+        self.peak_bytes = 0
+        self._profiler = None
+        self._started_tracing = False
+
+    def start(self) -> "Capture":
+        global _active_capture
+        with _lock:
+            if _active_capture is not None:
+                raise RuntimeError("capture already running")
+            _active_capture = self
+        try:
+            if self.memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            if self.profile:
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+        except BaseException:
+            # e.g. another profiler (a debugger) holds the hook; free the slot
+            self.stop()
+            raise
+        return self
+
+    def stop(self) -> "Capture":
+        global _active_capture
+        if _active_capture is not self:
+            return self
+        if self._profiler is not None:
+            self._profiler.disable()
+            output = io.StringIO()
+            pstats.Stats(self._profiler, stream=output).sort_stats("cumulative").print_stats(self.top)
+            self.profile_text = output.getvalue()
+            self._profiler = None
+        if self.memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            self.peak_bytes = tracemalloc.get_traced_memory()[1]
+            self.top_allocations = [str(stat) for stat in snapshot.statistics("lineno")[:self.top]]
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        with _lock:
+            _active_capture = None
+        return self
+
+    def __enter__(self) -> "Capture":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
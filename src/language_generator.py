@@ -1,40 +1,142 @@
 import random
 import re
-from typing import Dict, List
-import markovify
+import os
+from itertools import islice
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Sequence
+
+import language_store
+import phonotactics
+from evolution import LanguageTree
+from language_store import LanguageTable
+from vocabulary import LazyVocabulary, OverlayVocabulary, Vocabulary
+
+# Phonetic inventory for different language families, shared by every generator
+PHONEMES = MappingProxyType({
+    "elvish": ("ae", "th", "iel", "wen", "lor", "mir", "del", "ion", "eth", "uil"),
+    "dwarvish": ("thor", "din", "bal", "nor", "grim", "dur", "bok", "gron", "thok", "urn"),
+    "demonic": ("zul", "kath", "gor", "morg", "xul", "neth", "rax", "vorth", "zel", "ak"),
+    "celestial": ("cel", "est", "lum", "or", "ath", "riel", "phos", "hel", "aur", "sol"),
+})
+
+# Sentence structures per word order
+GRAMMAR_RULES = MappingProxyType({
+    "SOV": ("SUBJ OBJ VERB", "SUBJ OBJ ADJ VERB"),
+    "SVO": ("SUBJ VERB OBJ", "SUBJ VERB ADJ OBJ"),
+    "VSO": ("VERB SUBJ OBJ", "VERB SUBJ ADJ OBJ"),
+})
+
+# Endings appended to the words a derived language renames
+DERIVED_WORD_ENDINGS = ["a", "i", "o", "th", "n", "el", "ar"]
+
+
+def _derive_language(base_language: Dict, language_name: str, seed: str) -> Dict:
+    """Derive a related language from `base_language` using its own random stream"""
+    rng = random.Random(seed)
+    derived_lang = base_language.copy()
+    derived_lang["name"] = language_name
+    # Only the changes are stored; the base vocabulary stays untouched
+    vocabulary = derived_lang["vocabulary"] = OverlayVocabulary(base_language["vocabulary"])
+
+    # Modify some vocabulary (about 1/3 of words)
+    words_to_change = rng.sample(list(vocabulary.keys()), k=len(vocabulary) // 3)
+
+    for word in words_to_change:
+        new_word = word + rng.choice(DERIVED_WORD_ENDINGS)
+        # Keep the same word category
+        category = vocabulary[word]
+        vocabulary[new_word] = category
+        del vocabulary[word]
+
+    # Also change the grammar sometimes
+    if rng.random() > 0.7:  # 30% chance to change grammar
+        derived_lang["grammar_type"] = rng.choice(["SVO", "SOV", "VSO"])
+
+    return derived_lang
+
+
+# Base language of the family being derived, installed once per pool worker
+_worker_base_language = None
+
+
+def _init_family_worker(base_language: Dict):
+    global _worker_base_language
+    _worker_base_language = base_language
+
+
+def _derive_in_worker(language_name: str, seed: str):
+    # Ship back only the vocabulary delta, not the base it was laid over
+    derived_lang = _derive_language(_worker_base_language, language_name, seed)
+    vocabulary = derived_lang.pop("vocabulary")
+    return derived_lang, vocabulary.added, vocabulary.removed
+
 
 class AncientLanguageGenerator:
+    # Sentence slots and the vocabulary category that fills them
+    SLOT_CATEGORIES = {"SUBJ": "noun", "VERB": "verb", "OBJ": "noun", "ADJ": "adjective"}
+
+    WORD_CATEGORIES = ["noun", "verb", "adjective", "adverb", "preposition"]
+
+    # Common suffixes and prefixes for the different categories
+    AFFIXES = {
+        "noun": ["-ion", "-eth", "-ul", "-ar", "-en", "-il", "-or", "-ath"],
+        "verb": ["-ate", "-ish", "-ize", "-en", "-ify", "-es", "-eth"],
+        "adjective": ["-ic", "-al", "-ous", "-ive", "-y", "-ed", "-ing", "-an"],
+        "adverb": ["-ly", "-ward", "-wise", "-way", "-time"],
+        "preposition": ["a-", "be-", "for-", "with-", "out-"]
+    }
+
+    # Sentences in a lazy language draw on this many of its first words
+    LAZY_SENTENCE_WORDS = 1000
+
+    # Read-only tables shared by all instances
+    phonemes = PHONEMES
+    grammar_rules = GRAMMAR_RULES
+
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
-        
-        # Phonetic inventory for different language families
-        self.phonemes = {
-            "elvish": ["ae", "th", "iel", "wen", "lor", "mir", "del", "ion", "eth", "uil"],
-            "dwarvish": ["thor", "din", "bal", "nor", "grim", "dur", "bok", "gron", "thok", "urn"],
-            "demonic": ["zul", "kath", "gor", "morg", "xul", "neth", "rax", "vorth", "zel", "ak"],
-            "celestial": ["cel", "est", "lum", "or", "ath", "riel", "phos", "hel", "aur", "sol"]
-        }
-        
-        # Grammar rules
-        self.grammar_rules = {
-            "SOV": ["SUBJ OBJ VERB", "SUBJ OBJ ADJ VERB"],
-            "SVO": ["SUBJ VERB OBJ", "SUBJ VERB ADJ OBJ"],
-            "VSO": ["VERB SUBJ OBJ", "VERB SUBJ ADJ OBJ"]
-        }
-        
-        self.languages = {}
+        # Each generator owns its random stream so sessions never disturb each other
+        self.seed = seed
+        self.rng = random.Random(seed)
 
-    def generate_language(self, language_name: str, family: str = "elvish") -> Dict:
-        """Generate a complete fictional language with grammar and vocabulary"""
+        # Behaves like a dict; languages attached from disk are mapped on first use
+        self.languages = LanguageTable()
+        # language name -> (vocabulary, size, version, words by category)
+        self._pos_indexes = {}
+
+    def generate_language(self, language_name: str, family: str = "elvish",
+                          word_count: int = None, vectorized: bool = False,
+                          phonotactic: bool = False, lazy: bool = False) -> Dict:
+        """Generate a complete fictional language with grammar and vocabulary
+
+        `phonotactic` draws word stems from the family's trained n-gram model
+        (see phonotactics.py) instead of concatenating phonemes; it always
+        uses the vectorized path. `lazy` returns a LazyVocabulary whose words
+        are spelled on first use; without a `word_count` it never runs out.
+        """
         # Select phonemes based on language family
         base_phonemes = self.phonemes.get(family, self.phonemes["elvish"])
         
-        # Generate vocabulary (50-100 words)
-        vocabulary = self._generate_vocabulary(base_phonemes, word_count=random.randint(50, 100))
+        # Generate vocabulary (50-100 words unless a size is requested)
+        if word_count is None and not lazy:
+            word_count = self.rng.randint(50, 100)
+        if lazy:
+            vocabulary = LazyVocabulary(base_phonemes, self.AFFIXES, self.rng.getrandbits(64), size=word_count)
+        elif phonotactic:
+            vocabulary = self._generate_vocabulary_vectorized(
+                base_phonemes, word_count, seed=self.rng.getrandbits(64),
+                model=phonotactics.get_model(family)
+            )
+        elif vectorized:
+            vocabulary = self._generate_vocabulary_vectorized(
+                base_phonemes, word_count, seed=self.rng.getrandbits(64)
+            )
+        else:
+            vocabulary = self._generate_vocabulary(base_phonemes, word_count=word_count)
+        if not lazy:
+            vocabulary = Vocabulary(vocabulary)
         
         # Select grammar structure
-        grammar_type = random.choice(list(self.grammar_rules.keys()))
+        grammar_type = self.rng.choice(list(self.grammar_rules.keys()))
         
         # Generate morphological rules
         morphology = self._generate_morphology()
@@ -51,55 +153,169 @@ class AncientLanguageGenerator:
         self.languages[language_name] = language
         return language
 
-    def _generate_vocabulary(self, phonemes: List[str], word_count: int) -> Dict[str, str]:
+    def _generate_vocabulary(self, phonemes: Sequence[str], word_count: int) -> Dict[str, str]:
         """Generate vocabulary using phonetic patterns and rules"""
         vocabulary = {}
-        categories = ["noun", "verb", "adjective", "adverb", "preposition"]
-        
-        # Define some common suffixes and prefixes for different categories
-        affixes = {
-            "noun": ["-ion", "-eth", "-ul", "-ar", "-en", "-il", "-or", "-ath"],
-            "verb": ["-ate", "-ish", "-ize", "-en", "-ify", "-es", "-eth"],
-            "adjective": ["-ic", "-al", "-ous", "-ive", "-y", "-ed", "-ing", "-an"],
-            "adverb": ["-ly", "-ward", "-wise", "-way", "-time"],
-            "preposition": ["a-", "be-", "for-", "with-", "out-"]
-        }
+        categories = self.WORD_CATEGORIES
+        affixes = self.AFFIXES
 
         for i in range(word_count):
-            category = random.choice(categories)
+            category = self.rng.choice(categories)
             
             # Build a word from 1-3 phonemes
-            num_phonemes = random.randint(1, 3)
+            num_phonemes = self.rng.randint(1, 3)
             base_word = ""
             
             for _ in range(num_phonemes):
-                base_word += random.choice(phonemes)
+                base_word += self.rng.choice(phonemes)
             
             # Add category-appropriate affixes with some probability
-            if random.random() > 0.3:  # 70% chance to add an affix
+            if self.rng.random() > 0.3:  # 70% chance to add an affix
                 if category in affixes:
-                    if category == "preposition" and random.random() > 0.5:
+                    if category == "preposition" and self.rng.random() > 0.5:
                         # Add prefix for prepositions
-                        base_word = random.choice(affixes[category]) + base_word
+                        base_word = self.rng.choice(affixes[category]) + base_word
                     else:
                         # Add suffix for other categories
-                        base_word += random.choice(affixes[category])
+                        base_word += self.rng.choice(affixes[category])
             
             # Ensure the word is not empty and unique
             if base_word and base_word not in vocabulary:
                 vocabulary[base_word] = category
         
         return vocabulary
+
+    def _generate_vocabulary_vectorized(self, phonemes: Sequence[str], word_count: int,
+                                        seed: int = None, model=None,
+                                        exclude: Iterable[str] = None) -> Dict[str, str]:
+        """Generate exactly `word_count` unique words, drawing all choices as NumPy arrays
+
+        Stems are phoneme concatenations, or samples from `model` (a
+        phonotactics.PhonotacticModel) when one is given. Words in `exclude`
+        are never produced.
+        """
+        if word_count <= 0:
+            return {}
+
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
+        categories = self.WORD_CATEGORIES
+        prep_code = categories.index("preposition")
+
+        # Allow longer words until there are comfortably more distinct phoneme
+        # combinations than requested words, otherwise uniqueness cannot be met
+        excluded = list(exclude or ())
+        num_phonemes = len(phonemes)
+        max_phonemes = 3
+        while sum(num_phonemes ** k for k in range(1, max_phonemes + 1)) < 2 * (word_count + len(excluded)):
+            max_phonemes += 1
+
+        # The trailing empty string pads words shorter than max_phonemes
+        phoneme_table = np.array(list(phonemes) + [""])
+        affix_table = np.array([a for c in categories for a in self.AFFIXES[c]])
+        affix_counts = np.array([len(self.AFFIXES[c]) for c in categories])
+        affix_offsets = np.concatenate(([0], np.cumsum(affix_counts)[:-1]))
+
+        words = []
+        codes = []
+        seen = np.sort(self._word_keys(np.array(excluded, dtype=str))) if excluded else np.array([], dtype=np.uint64)
+        found = 0
+        # Model stems are compounded once the model stops producing new words
+        stem_parts = 1
+        while found < word_count:
+            batch = int((word_count - found) * 1.5) + 64
+
+            category = rng.integers(0, len(categories), size=batch)
+            if model is None:
+                lengths = rng.integers(1, max_phonemes + 1, size=batch)
+                picks = rng.integers(0, num_phonemes, size=(batch, max_phonemes))
+                picks[np.arange(max_phonemes) >= lengths[:, None]] = num_phonemes
+
+                base = phoneme_table[picks[:, 0]]
+                for column in range(1, max_phonemes):
+                    base = np.char.add(base, phoneme_table[picks[:, column]])
+            else:
+                base = model.sample(batch, rng)
+                for _ in range(1, stem_parts):
+                    base = np.char.add(base, model.sample(batch, rng))
+
+            # 70% of words get an affix; prepositions put it in front half of the time
+            has_affix = rng.random(batch) > 0.3
+            as_prefix = has_affix & (category == prep_code) & (rng.random(batch) > 0.5)
+            choice = (rng.random(batch) * affix_counts[category]).astype(np.int64)
+            affix = affix_table[affix_offsets[category] + choice]
+            empty = np.full(batch, "", dtype=affix.dtype)
+
+            candidates = np.char.add(
+                np.char.add(np.where(as_prefix, affix, empty), base),
+                np.where(has_affix & ~as_prefix, affix, empty),
+            )
+
+            # Deduplicate on a 64-bit hash of the code points, which sorts far
+            # faster than strings. A hash clash can only drop a candidate, never
+            # admit a duplicate, so the result is still exactly unique.
+            keys = self._word_keys(candidates)
+
+            # Keep the first occurrence of each new word, in draw order
+            _, first = np.unique(keys, return_index=True)
+            first.sort()
+            slots = np.searchsorted(seen, keys[first]).clip(max=max(len(seen) - 1, 0))
+            known = seen[slots] == keys[first] if len(seen) else np.zeros(len(first), dtype=bool)
+            fresh = first[~known]
+            if model is not None and len(fresh) < batch // 4:
+                stem_parts += 1
+            fresh = fresh[:word_count - found]
+            seen = np.sort(np.concatenate((seen, keys[fresh])))
+            words.append(candidates[fresh].tolist())
+            codes.append(category[fresh])
+            found += len(fresh)
+
+        names = np.array(categories)[np.concatenate(codes)].tolist()
+        return dict(zip((w for chunk in words for w in chunk), names))
+
+    @staticmethod
+    def _word_keys(words):
+        """64-bit hash of each word in a NumPy string array, independent of its padding"""
+        import numpy as np
+
+        points = words.view(np.uint32).reshape(len(words), -1).astype(np.uint64)
+        keys = np.zeros(len(words), dtype=np.uint64)
+        for column in range(points.shape[1] - 1, -1, -1):
+            keys = keys * np.uint64(1000003) + points[:, column]
+        return keys
+
+    def extend_vocabulary(self, language_name: str, word_count: int, seed: int = None) -> Dict[str, str]:
+        """Add `word_count` new words to a language and return them"""
+        if language_name not in self.languages:
+            raise ValueError(f"Language {language_name} not found")
+
+        lang = self.languages[language_name]
+        vocabulary = lang["vocabulary"]
+        if isinstance(vocabulary, LazyVocabulary):
+            raise TypeError("Lazy vocabularies are spelled on demand and cannot be extended")
+        phonemes = self.phonemes.get(lang["family"], self.phonemes["elvish"])
+        if seed is None:
+            seed = self.rng.getrandbits(64)
+
+        added = self._generate_vocabulary_vectorized(phonemes, word_count, seed=seed, exclude=vocabulary)
+        if isinstance(vocabulary, Vocabulary):
+            vocabulary.update_pairs(added.items())
+        else:
+            vocabulary.update(added)
+        self.invalidate_pos_index(language_name)
+        return added
+
     def _generate_morphology(self) -> Dict:
         """Generate morphological rules for the language"""
         return {
-            "plural_rules": random.choice([
+            "plural_rules": self.rng.choice([
                 "add 'i' suffix", "add 'en' suffix", "vowel change", "add 'ath' suffix"
             ]),
-            "verb_conjugation": random.choice([
+            "verb_conjugation": self.rng.choice([
                 "regular", "irregular", "prefix-based", "tone-based"
             ]),
-            "case_system": random.choice([
+            "case_system": self.rng.choice([
                 "none", "nominative-accusative", "ergative-absolutive"
             ])
         }
@@ -111,7 +327,63 @@ class AncientLanguageGenerator:
             "geometric patterns", "dot-based notation",
             "circular glyphs", "linear phonetic symbols"
         ]
-        return random.choice(scripts)
+        return self.rng.choice(scripts)
+
+    def _get_pos_index(self, language_name: str) -> Dict[str, List[str]]:
+        """Return the language's words grouped by category, building it on first use"""
+        vocabulary = self.languages[language_name]['vocabulary']
+        lazy = isinstance(vocabulary, LazyVocabulary)
+        signature = (vocabulary, vocabulary.size if lazy else len(vocabulary), getattr(vocabulary, "version", None))
+        cached = self._pos_indexes.get(language_name)
+        if cached is not None and cached[0] is vocabulary and cached[1:3] == signature[1:]:
+            return cached[3]
+
+        index: Dict[str, List[str]] = {}
+        if isinstance(vocabulary, Vocabulary):
+            # Packed vocabularies slice a category without touching other words
+            for category in vocabulary.categories:
+                index[category] = vocabulary.words_in(category)
+        else:
+            items = vocabulary.items()
+            if lazy:
+                # A lazy language may be unbounded; sentences use its first words
+                items = islice(items, self.LAZY_SENTENCE_WORDS)
+            for word, category in items:
+                index.setdefault(category, []).append(word)
+        self._pos_indexes[language_name] = signature + (index,)
+        return index
+
+    def invalidate_pos_index(self, language_name: str = None):
+        """Drop cached part-of-speech indexes after a vocabulary was edited in place"""
+        if language_name is None:
+            self._pos_indexes.clear()
+        else:
+            self._pos_indexes.pop(language_name, None)
+
+    def _fill_clause(self, structure: str, pos_index: Dict[str, List[str]]) -> str:
+        """Replace the slot placeholders of a clause structure with words"""
+        clause = structure
+        for placeholder in ["SUBJ", "VERB", "OBJ", "ADJ"]:
+            if placeholder in clause:
+                category_words = pos_index.get(self.SLOT_CATEGORIES[placeholder])
+                if category_words:
+                    clause = clause.replace(placeholder, self.rng.choice(category_words), 1)
+        return clause
+
+    def _build_sentence(self, lang: Dict, pos_index: Dict[str, List[str]], complexity: int) -> str:
+        """Build one sentence of `complexity` clauses joined by connecting words"""
+        structures = self.grammar_rules.get(lang['grammar_type'], self.grammar_rules["VSO"])
+        clauses = [self._fill_clause(self.rng.choice(structures), pos_index)]
+
+        # Extra clauses are linked with the language's own prepositions or adverbs
+        connectors = pos_index.get("preposition") or pos_index.get("adverb")
+        for _ in range(complexity - 1):
+            clause = self._fill_clause(self.rng.choice(structures), pos_index)
+            if connectors:
+                clause = f"{self.rng.choice(connectors)} {clause}"
+            clauses.append(clause)
+
+        return ", ".join(clauses).capitalize()
 
     def generate_sentence(self, language_name: str, complexity: int = 1) -> str:
         """Generate a sentence in the created language"""
@@ -119,67 +391,86 @@ class AncientLanguageGenerator:
             raise ValueError(f"Language {language_name} not found")
         
         lang = self.languages[language_name]
-        words = list(lang['vocabulary'].keys())
-        
-        # Simple sentence generation based on grammar type
-        if lang['grammar_type'] == "SVO":
-            structure = random.choice(["SUBJ VERB OBJ", "SUBJ VERB ADJ OBJ"])
-        elif lang['grammar_type'] == "SOV":
-            structure = random.choice(["SUBJ OBJ VERB", "SUBJ OBJ ADJ VERB"])
-        else:  # VSO
-            structure = random.choice(["VERB SUBJ OBJ", "VERB SUBJ ADJ OBJ"])
-        
-        # Replace placeholders with actual words
-        sentence = structure
-        for placeholder in ["SUBJ", "VERB", "OBJ", "ADJ"]:
-            if placeholder in sentence:
-                # Get words of appropriate category
-                if placeholder == "SUBJ" or placeholder == "OBJ":
-                    category_words = [w for w, cat in lang['vocabulary'].items() if cat == "noun"]
-                elif placeholder == "VERB":
-                    category_words = [w for w, cat in lang['vocabulary'].items() if cat == "verb"]
-                elif placeholder == "ADJ":
-                    category_words = [w for w, cat in lang['vocabulary'].items() if cat == "adjective"]
-                
-                if category_words:
-                    sentence = sentence.replace(placeholder, random.choice(category_words), 1)
-        
-        return sentence.capitalize()
+        return self._build_sentence(lang, self._get_pos_index(language_name), max(1, complexity))
 
-    def create_language_family(self, base_name: str, num_languages: int = 3) -> Dict:
-        """Create a family of related languages"""
+    def generate_sentences(self, language_name: str, n: int, complexity: int = 1) -> List[str]:
+        """Generate `n` sentences in one call, reusing the part-of-speech index"""
+        if language_name not in self.languages:
+            raise ValueError(f"Language {language_name} not found")
+
+        lang = self.languages[language_name]
+        pos_index = self._get_pos_index(language_name)
+        complexity = max(1, complexity)
+        return [self._build_sentence(lang, pos_index, complexity) for _ in range(n)]
+
+    def save_language(self, language_name: str, path: str) -> str:
+        """Persist a language in the compact binary format and return the file path"""
+        if language_name not in self.languages:
+            raise ValueError(f"Language {language_name} not found")
+        if os.path.isdir(path):
+            path = os.path.join(path, language_name + language_store.LANGUAGE_FILE_SUFFIX)
+        language_store.save_language(self.languages[language_name], path)
+        return path
+
+    def load_language(self, path: str, lazy: bool = False):
+        """Load a stored language; with lazy=True it is only mapped when first used"""
+        name = self.languages.register_file(path)
+        self.invalidate_pos_index(name)
+        return name if lazy else self.languages[name]
+
+    def attach_store(self, directory: str) -> List[str]:
+        """Register every stored language in a directory for lazy loading"""
+        names = []
+        for entry in sorted(os.listdir(directory)):
+            if entry.endswith(language_store.LANGUAGE_FILE_SUFFIX):
+                names.append(self.load_language(os.path.join(directory, entry), lazy=True))
+        return names
+
+    def _child_seed(self, key: str) -> str:
+        """Draw a seed for a deterministic child stream tied to `key`"""
+        return f"{self.rng.getrandbits(64)}:{key}"
+
+    def create_language_tree(self, base_name: str, branching=(3, 3, 3), family: str = "elvish",
+                             word_count: int = None) -> LanguageTree:
+        """Start a deep family tree evolving from a proto-language by sound change.
+
+        Nodes are built on request (see evolution.LanguageTree); an existing
+        language named `base_name` is used as the proto-language.
+        """
+        if base_name not in self.languages:
+            self.generate_language(base_name, family, word_count=word_count)
+        return LanguageTree(self, base_name, branching, seed=self._child_seed(base_name))
+
+    def create_language_family(self, base_name: str, num_languages: int = 3, workers: int = None) -> Dict:
+        """Create a family of related languages, optionally deriving members across processes"""
         family = {}
         
         # Create the base language and add it to the main registry
         base_language = self.generate_language(f"{base_name}_prime", "elvish")
         family[f"{base_name}_prime"] = base_language
         self.languages[f"{base_name}_prime"] = base_language  # ← THIS LINE WAS MISSING
-        
-        for i in range(1, num_languages):
-            # Create derived languages with shared vocabulary
-            derived_lang = base_language.copy()
-            derived_lang_name = f"{base_name}_{i}"
-            derived_lang["name"] = derived_lang_name
-            
-            # Modify some vocabulary (about 1/3 of words)
-            words_to_change = random.sample(
-                list(derived_lang["vocabulary"].keys()), 
-                k=len(derived_lang["vocabulary"]) // 3
-            )
-            
-            for word in words_to_change:
-                new_word = word + random.choice(["a", "i", "o", "th", "n", "el", "ar"])
-                # Keep the same word category
-                category = derived_lang["vocabulary"][word]
-                derived_lang["vocabulary"][new_word] = category
-                del derived_lang["vocabulary"][word]
-            
-            # Also change the grammar sometimes
-            if random.random() > 0.7:  # 30% chance to change grammar
-                derived_lang["grammar_type"] = random.choice(["SVO", "SOV", "VSO"])
-            
+
+        # Every member gets its own child stream, seeded up front, so the
+        # result does not depend on how the derivations are scheduled
+        names = [f"{base_name}_{i}" for i in range(1, num_languages)]
+        seeds = [self._child_seed(name) for name in names]
+
+        if workers and workers > 1 and len(names) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_family_worker,
+                                     initargs=(base_language,)) as pool:
+                derived = []
+                for derived_lang, added, removed in pool.map(_derive_in_worker, names, seeds):
+                    derived_lang["vocabulary"] = OverlayVocabulary(base_language["vocabulary"], added, removed)
+                    derived.append(derived_lang)
+        else:
+            derived = [_derive_language(base_language, name, seed) for name, seed in zip(names, seeds)]
+
+        for derived_lang in derived:
             # Add to both the family and the main languages registry
-            family[derived_lang_name] = derived_lang
-            self.languages[derived_lang_name] = derived_lang  # ← THIS LINE WAS MISSING
+            family[derived_lang["name"]] = derived_lang
+            self.languages[derived_lang["name"]] = derived_lang  # ← THIS LINE WAS MISSING
+            self.invalidate_pos_index(derived_lang["name"])
         
-        return family 
\ No newline at end of file
+        return family
@@ -0,0 +1,121 @@
+import threading
+import weakref
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Hashable, Mapping, Optional, Tuple
+
+from language_generator import AncientLanguageGenerator
+
+# Languages are content-addressed by the inputs that fully determine them
+LanguageKey = Tuple[str, str, int]
+
+
+def freeze_language(language: Dict) -> Mapping:
+    """Return a read-only view of a language whose vocabulary rejects writes"""
+    frozen = dict(language)
+    frozen["morphology"] = MappingProxyType(dict(language["morphology"]))
+    vocabulary = frozen["vocabulary"]
+    if hasattr(vocabulary, "freeze"):
+        vocabulary.freeze()
+    else:
+        frozen["vocabulary"] = MappingProxyType(dict(vocabulary))
+    return MappingProxyType(frozen)
+
+
+class LanguageHandle:
+    """A session's reference to a shared language; dropping it releases the reference"""
+    __slots__ = ("key", "language", "_finalizer", "__weakref__")
+
+    def __init__(self, registry: "LanguageRegistry", key: LanguageKey, language: Mapping):
+        self.key = key
+        self.language = language
+        self._finalizer = weakref.finalize(self, registry.release, key)
+
+    def release(self):
+        """Give the reference back now rather than when the handle is collected"""
+        self._finalizer()
+
+
+class LanguageRegistry:
+    """Process-wide, thread-safe store of seeded languages shared between sessions.
+
+    Reads are plain dict lookups and take no lock. Building and reference
+    counting are serialised; unreferenced languages stay cached until more
+    than `max_idle` of them pile up, then the least recently released go first.
+    """
+
+    def __init__(self, max_idle: int = 32):
+        self.max_idle = max_idle
+        self._languages: Dict[LanguageKey, Mapping] = {}
+        self._refs: Dict[LanguageKey, int] = {}
+        self._idle: "OrderedDict[LanguageKey, None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[Hashable, threading.Lock] = {}
+
+    def get(self, name: str, family: str, seed: int) -> Optional[Mapping]:
+        """Return the shared language if it is already built"""
+        return self._languages.get((name, family, seed))
+
+    def _build(self, key: LanguageKey) -> Mapping:
+        with self._lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        # Only one thread builds a given language; the others wait and reuse it
+        with build_lock:
+            language = self._languages.get(key)
+            if language is None:
+                name, family, seed = key
+                built = freeze_language(AncientLanguageGenerator(seed).generate_language(name, family))
+                with self._lock:
+                    # Stored before the build lock is dropped, so late arrivals find it
+                    language = self._languages.setdefault(key, built)
+            with self._lock:
+                self._build_locks.pop(key, None)
+        return language
+
+    def acquire(self, name: str, family: str, seed: int) -> LanguageHandle:
+        """Return a handle to the shared language, building it on first request"""
+        key = (name, family, seed)
+        language = self._languages.get(key)
+        if language is None:
+            language = self._build(key)
+
+        with self._lock:
+            # Re-insert in case the entry was evicted since the lock-free read
+            language = self._languages.setdefault(key, language)
+            self._refs[key] = self._refs.get(key, 0) + 1
+            self._idle.pop(key, None)
+        return LanguageHandle(self, key, language)
+
+    def release(self, key: LanguageKey):
+        with self._lock:
+            refs = self._refs.get(key, 0) - 1
+            if refs > 0:
+                self._refs[key] = refs
+                return
+            self._refs.pop(key, None)
+            self._idle[key] = None
+            while len(self._idle) > self.max_idle:
+                evicted, _ = self._idle.popitem(last=False)
+                self._languages.pop(evicted, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Entry counts and the approximate bytes held by shared vocabularies"""
+        languages = list(self._languages.values())
+        vocabulary_bytes = sum(
+            language["vocabulary"].memory_usage()
+            for language in languages if hasattr(language["vocabulary"], "memory_usage")
+        )
+        with self._lock:
+            references = sum(self._refs.values())
+            idle = len(self._idle)
+        return {
+            "languages": len(languages),
+            "references": references,
+            "idle": idle,
+            "vocabulary_bytes": vocabulary_bytes,
+        }
+
+
+# The registry shared by every session served from this process
+shared_languages = LanguageRegistry()
@@ -0,0 +1,144 @@
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, Iterator, Union
+
+from vocabulary import LazyVocabulary, Vocabulary
+
+# File layout (little-endian, sections padded to 8 bytes):
+#   magic | header | metadata JSON | offsets (uint32) | codes (uint8) | table (int32) | words (UTF-8)
+MAGIC = b"LALANG01"
+_HEADER = struct.Struct("<QQQQ")  # metadata bytes, word count, table slots, word buffer bytes
+LANGUAGE_FILE_SUFFIX = ".lang"
+
+PathLike = Union[str, os.PathLike]
+
+
+def _padded(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def save_language(language: Dict, path: PathLike):
+    """Write a language to the compact binary format"""
+    # Read-only views (e.g. of registry languages) are stored as plain objects
+    metadata = {key: dict(value) if isinstance(value, Mapping) else value
+                for key, value in language.items() if key != "vocabulary"}
+    vocabulary = language["vocabulary"]
+    if isinstance(vocabulary, LazyVocabulary):
+        # Only the recipe is stored; the words are spelled again after loading
+        metadata["lazy_vocabulary"] = vocabulary.spec()
+        vocabulary = Vocabulary()
+    elif not isinstance(vocabulary, Vocabulary) or vocabulary.is_mapped:
+        # Overlays and mapped vocabularies are flattened into a fresh packed copy
+        vocabulary = Vocabulary.from_pairs(vocabulary.items())
+    words, offsets, codes, table = vocabulary.packed_buffers()
+
+    metadata["categories"] = vocabulary.categories
+    meta = json.dumps(metadata).encode("utf-8")
+
+    sections = [meta, offsets.tobytes(), codes.tobytes(), table.tobytes(), bytes(words)]
+    # Write beside the target and rename: languages loaded from the old file
+    # keep their mapping of it instead of seeing it rewritten under them
+    temporary = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as handle:
+            handle.write(MAGIC)
+            handle.write(_HEADER.pack(len(meta), len(codes), len(table), len(words)))
+            for section in sections:
+                handle.write(section)
+                handle.write(b"\0" * (_padded(len(section)) - len(section)))
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def _read_header(handle):
+    if handle.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"{getattr(handle, 'name', 'file')} is not a language file")
+    return _HEADER.unpack(handle.read(_HEADER.size))
+
+
+def read_language_metadata(path: PathLike) -> Dict:
+    """Read only the metadata block (name, family, grammar, ...) of a language file"""
+    with open(path, "rb") as handle:
+        meta_size = _read_header(handle)[0]
+        return json.loads(handle.read(meta_size))
+
+
+def load_language(path: PathLike) -> Dict:
+    """Map a language file into memory; vocabulary pages are read on demand"""
+    with open(path, "rb") as handle:
+        meta_size, count, table_slots, words_size = _read_header(handle)
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    position = len(MAGIC) + _HEADER.size
+    metadata = json.loads(bytes(view[position:position + meta_size]))
+    position += _padded(meta_size)
+
+    sections = []
+    for size, fmt in (((count + 1) * 4, "I"), (count, "B"), (table_slots * 4, "i"), (words_size, "B")):
+        sections.append(view[position:position + size].cast(fmt))
+        position += _padded(size)
+    offsets, codes, table, words = sections
+
+    language = dict(metadata)
+    categories = language.pop("categories")
+    if "lazy_vocabulary" in language:
+        language["vocabulary"] = LazyVocabulary(**language.pop("lazy_vocabulary"))
+    else:
+        language["vocabulary"] = Vocabulary.from_buffers(words, offsets, codes, table, categories)
+    return language
+
+
+class LanguageTable(MutableMapping):
+    """Registry of languages that opens stored languages on first access"""
+
+    def __init__(self):
+        self._loaded: Dict[str, Dict] = {}
+        self._pending: Dict[str, str] = {}
+
+    def register_file(self, path: PathLike) -> str:
+        """Make a stored language available by name without mapping it yet"""
+        name = read_language_metadata(path)["name"]
+        # The file replaces a language of the same name already in memory
+        self._loaded.pop(name, None)
+        self._pending[name] = os.fspath(path)
+        return name
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    def __getitem__(self, name: str) -> Dict:
+        language = self._loaded.get(name)
+        if language is None:
+            path = self._pending.pop(name)  # KeyError for unknown names
+            language = self._loaded[name] = load_language(path)
+        return language
+
+    def __contains__(self, name) -> bool:
+        return name in self._loaded or name in self._pending
+
+    def __setitem__(self, name: str, language: Dict):
+        self._pending.pop(name, None)
+        self._loaded[name] = language
+
+    def __delitem__(self, name: str):
+        if name in self._loaded:
+            del self._loaded[name]
+        else:
+            del self._pending[name]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._loaded)
+        yield from list(self._pending)
+
+    def __len__(self) -> int:
+        return len(self._loaded) + len(self._pending)
+
+    def __repr__(self) -> str:
+        return f"LanguageTable({len(self._loaded)} loaded, {len(self._pending)} on disk)"
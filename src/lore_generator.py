@@ -1,87 +1,156 @@
 import random
+from collections import Counter
+from types import MappingProxyType
+from typing import Iterable, List, Tuple
+
+from template_grammar import TemplateGrammar
+
+
+class RuneAnalysis:
+    """Symbol frequencies of one inscription, computed in a single pass"""
+    __slots__ = ("inscription", "counts", "total")
+
+    def __init__(self, inscription: str):
+        self.inscription = inscription
+        # Counter keeps first-seen order, so ties rank by first appearance
+        self.counts = Counter(inscription)
+        self.counts.pop(" ", None)
+        self.total = sum(self.counts.values())
+
+    @property
+    def unique(self) -> int:
+        return len(self.counts)
+
+    def most_common(self, n: int = None) -> List[Tuple[str, int]]:
+        """Return the `n` most frequent runes with their counts"""
+        return self.counts.most_common(n)
+
+    def frequency(self, rune: str) -> float:
+        """Share of the inscription (spaces excluded) taken up by `rune`"""
+        return self.counts.get(rune, 0) / self.total if self.total else 0.0
+
+
+# Meanings for common runic symbols
+RUNE_MEANINGS = MappingProxyType({
+    "ᚠ": ("wealth", "cattle", "nourishment", "abundance"),
+    "ᚢ": ("strength", "resilience", "primal force", "endurance"),
+    "ᚦ": ("danger", "conflict", "protection", "threshold"),
+    "ᚥ": ("magic", "mystery", "the unknown", "arcane power"),
+    "ᚤ": ("journey", "path", "destiny", "travel"),
+    "ᚨ": ("divinity", "inspiration", "higher power", "gods"),
+    "ᚾ": ("necessity", "constraint", "fate", "need"),
+    " ": ("separation", "pause", "breath", "transition"),
+})
+
+# The peoples each language family is attributed to
+LANGUAGE_ORIGINS = MappingProxyType({
+    "elvish": ("ancient forest dwellers", "moon-worshipping scholars", "nature guardians"),
+    "dwarvish": ("mountain clans", "deep-earth miners", "stone-shaping artisans"),
+    "demonic": ("shadow realm entities", "forgotten abyss dwellers", "chaos manifestations"),
+    "celestial": ("star-born beings", "light messengers", "sky deities"),
+})
+
+
+def analyze_runes(rune_script: str) -> RuneAnalysis:
+    """Count every rune of an inscription in one pass"""
+    return RuneAnalysis(rune_script)
+
 
 class LoreGenerator:
-    def __init__(self):
-        # Define actual meanings for common runic symbols
-        self.rune_meanings = {
-            "ᚠ": ["wealth", "cattle", "nourishment", "abundance"],
-            "ᚢ": ["strength", "resilience", "primal force", "endurance"],
-            "ᚦ": ["danger", "conflict", "protection", "threshold"],
-            "ᚥ": ["magic", "mystery", "the unknown", "arcane power"],
-            "ᚤ": ["journey", "path", "destiny", "travel"],
-            "ᚨ": ["divinity", "inspiration", "higher power", "gods"],
-            "ᚾ": ["necessity", "constraint", "fate", "need"],
-            " ": ["separation", "pause", "breath", "transition"]
-        }
-        
-        self.language_origins = {
-            "elvish": ["ancient forest dwellers", "moon-worshipping scholars", "nature guardians"],
-            "dwarvish": ["mountain clans", "deep-earth miners", "stone-shaping artisans"],
-            "demonic": ["shadow realm entities", "forgotten abyss dwellers", "chaos manifestations"],
-            "celestial": ["star-born beings", "light messengers", "sky deities"]
-        }
+    # Expansion rules for language lore; #name#, #people#, #script#,
+    # #grammar_type# and #plural_rules# are bound per language
+    LANGUAGE_LORE_RULES = {
+        "origin": [
+            "The #name# tongue was spoken by #people#. "
+            "Their #script# writing system reflects their #tradition#. "
+            "With its #grammar_type# structure, this language is perfect for #purpose#.",
+
+            "Originating from #people#, #name# features #sound# sounds suited for #setting#. "
+            "The #plural_rules# plural rules make it ideal for #record#."
+        ],
+        "tradition": ["connection to nature", "stone-crafting traditions", "arcane studies", "celestial observations"],
+        "purpose": ["complex spellcasting", "precise engineering", "poetic verses", "ritual incantations"],
+        "sound": ["flowing", "harsh", "melodic", "guttural"],
+        "setting": ["whispered secrets", "mountain echoes", "forest songs", "temple chants"],
+        "record": ["describing magical phenomena", "documenting history", "reciting prophecies", "recording recipes"]
+    }
+
+    RUNE_LORE_INTROS = [
+        "This inscription '{runes}' was carved for {intent}.",
+        "The runes '{runes}' hold power related to {intent}.",
+        "Ancient artisans created this pattern '{runes}' to achieve {intent}."
+    ]
+
+    RUNE_LORE_INTERPRETATIONS = [
+        "\nTogether, these runes create a harmonious magical field.",
+        "\nThe arrangement suggests a protective or enhancing effect.",
+        "\nThis pattern channels elemental energies effectively.",
+        "\nThe repetition indicates a focused, powerful intention."
+    ]
+
+    # Read-only tables and the compiled lore grammar, shared by all instances
+    rune_meanings = RUNE_MEANINGS
+    language_origins = LANGUAGE_ORIGINS
+    language_grammar = TemplateGrammar(LANGUAGE_LORE_RULES)
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
 
     def generate_language_lore(self, language_data: dict) -> str:
         """Generate lore explaining the language's origins and features"""
         family = language_data.get('family', 'elvish')
-        origins = self.language_origins.get(family, self.language_origins['elvish'])
-        
-        lore_templates = [
-            f"The {language_data['name']} tongue was spoken by {random.choice(origins)}. "
-            f"Their {language_data['script']} writing system reflects their "
-            f"{random.choice(['connection to nature', 'stone-crafting traditions', 'arcane studies', 'celestial observations'])}. "
-            f"With its {language_data['grammar_type']} structure, this language is perfect for "
-            f"{random.choice(['complex spellcasting', 'precise engineering', 'poetic verses', 'ritual incantations'])}.",
-            
-            f"Originating from {random.choice(origins)}, {language_data['name']} features "
-            f"{random.choice(['flowing', 'harsh', 'melodic', 'guttural'])} sounds suited for "
-            f"{random.choice(['whispered secrets', 'mountain echoes', 'forest songs', 'temple chants'])}. "
-            f"The {language_data['morphology']['plural_rules']} plural rules make it ideal for "
-            f"{random.choice(['describing magical phenomena', 'documenting history', 'reciting prophecies', 'recording recipes'])}."
-        ]
-        
-        return random.choice(lore_templates)
+        context = {
+            "name": language_data['name'],
+            "people": self.language_origins.get(family, self.language_origins['elvish']),
+            "script": language_data['script'],
+            "grammar_type": language_data['grammar_type'],
+            "plural_rules": language_data['morphology']['plural_rules']
+        }
+        return self.language_grammar.expand("origin", context, self.rng)
+
+    def generate_language_lore_many(self, languages: Iterable[dict]) -> List[str]:
+        """Generate lore for a whole set of languages, e.g. every member of a family"""
+        if isinstance(languages, dict):
+            languages = languages.values()
+        return [self.generate_language_lore(language) for language in languages]
 
-    def generate_rune_lore(self, rune_script: str, intent: str) -> str:
+    def generate_rune_lore(self, rune_script: str, intent: str, analysis: RuneAnalysis = None) -> str:
         """Generate meaningful lore for runic inscriptions"""
-        # Clean the rune script and get unique symbols
-        clean_runes = rune_script.replace(' ', '')
-        unique_runes = list(set(clean_runes))
-        
+        if analysis is None:
+            analysis = analyze_runes(rune_script)
+
         # Analyze the most common runes
-        rune_counts = {rune: clean_runes.count(rune) for rune in unique_runes}
-        significant_runes = sorted(rune_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        significant_runes = analysis.most_common(3)
         
         # Build the lore
-        lore_parts = []
-        
-        # Introduction
-        intros = [
-            f"This inscription '{rune_script}' was carved for {intent.lower()}.",
-            f"The runes '{rune_script}' hold power related to {intent.lower()}.",
-            f"Ancient artisans created this pattern '{rune_script}' to achieve {intent.lower()}."
+        lore_parts = [
+            self.rng.choice(self.RUNE_LORE_INTROS).format(runes=rune_script, intent=intent.lower())
         ]
-        lore_parts.append(random.choice(intros))
         
         # Describe significant runes
         if significant_runes:
             lore_parts.append("\nThe symbols represent:")
             for rune, count in significant_runes:
                 if rune in self.rune_meanings:
-                    meaning = random.choice(self.rune_meanings[rune])
+                    meaning = self.rng.choice(self.rune_meanings[rune])
                     lore_parts.append(f"- '{rune}' signifies {meaning} (appears {count} times)")
         
         # Overall interpretation
-        interpretations = [
-            "\nTogether, these runes create a harmonious magical field.",
-            "\nThe arrangement suggests a protective or enhancing effect.",
-            "\nThis pattern channels elemental energies effectively.",
-            "\nThe repetition indicates a focused, powerful intention."
-        ]
-        lore_parts.append(random.choice(interpretations))
+        lore_parts.append(self.rng.choice(self.RUNE_LORE_INTERPRETATIONS))
         
         return "\n".join(lore_parts)
 
+    def generate_rune_lore_batch(self, inscriptions: Iterable[Tuple[str, str]]) -> List[str]:
+        """Generate lore for many (rune_script, intent) pairs, analysing each distinct script once"""
+        analyses = {}
+        results = []
+        for rune_script, intent in inscriptions:
+            analysis = analyses.get(rune_script)
+            if analysis is None:
+                analysis = analyses[rune_script] = analyze_runes(rune_script)
+            results.append(self.generate_rune_lore(rune_script, intent, analysis))
+        return results
+
 # Example usage:
 if __name__ == "__main__":
     lore_gen = LoreGenerator()
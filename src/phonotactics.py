@@ -0,0 +1,237 @@
+"""Character n-gram phonotactic models for word stems.
+
+A model is trained with markovify on a seed lexicon per language family and
+then compiled into flat NumPy alias tables, so drawing millions of stems is
+a handful of vectorized lookups per character instead of a Python loop per
+word. Compiled tables are cached on disk, keyed by a hash of the lexicon and
+n-gram order, so later runs skip training altogether.
+"""
+import json
+import os
+from typing import Dict, List, Sequence
+
+# Seed lexicons the family models learn their sound patterns from
+SEED_LEXICONS = {
+    "elvish": [
+        "aelin", "elanor", "thalion", "miriel", "lorien", "galadh", "ithil", "anor",
+        "eldar", "silmar", "nimloth", "faelas", "lindon", "celeb", "aerin", "tirion",
+        "elwen", "mithrel", "aranel", "ilmare", "nienor", "varda", "erendil", "luthien",
+        "amarie", "orome", "belthil", "finrod", "idril", "linwe", "aewen", "thelor",
+        "mirdan", "calen", "ithilwen", "laurel", "nerdanel", "sirion", "elenath", "glorwen",
+    ],
+    "dwarvish": [
+        "thorin", "dain", "balin", "dwalin", "gloin", "oin", "nori", "dori",
+        "grimbold", "durin", "bokhar", "gronmar", "thrakk", "khazad", "baruk", "dumbar",
+        "norgrim", "urnak", "borin", "thrain", "fundin", "kragdur", "gimrak", "hadrun",
+        "brokk", "dolgrim", "karaz", "zirak", "gundabad", "thrund", "bardok", "orlak",
+        "grundin", "kazrik", "thorgar", "bofur", "narvi", "dunrak", "hurgrim", "tharbad",
+    ],
+    "demonic": [
+        "zulkath", "morgath", "xulnar", "vorthax", "nethrak", "gorzul", "azrath", "kazzul",
+        "raxxis", "zelgor", "akrath", "vorzak", "thraxis", "molgrath", "xalthur", "zarnok",
+        "krathul", "nekroth", "urzgul", "baalzeth", "gorvax", "zhulath", "morkath", "skarnoth",
+        "vexul", "drakzul", "athrax", "zorvak", "nulgath", "kaxxor", "varzoth", "ghulrak",
+        "xoroth", "izrakh", "murzul", "thozgar", "raknath", "zelkor", "vulgrax", "ashkal",
+    ],
+    "celestial": [
+        "celestia", "lumiel", "auriel", "solaris", "phosel", "heliora", "estrael", "orith",
+        "athiel", "rielos", "lumos", "aurael", "selune", "caelum", "halion", "sorael",
+        "phaelis", "estelle", "orion", "lucien", "heloise", "aurora", "celion", "lumina",
+        "solenne", "asteria", "riela", "phosar", "elyon", "seraph", "ophiel", "theliel",
+        "aelios", "sariel", "luxor", "halcyon", "estaria", "aurelis", "celestin", "vesper",
+    ],
+}
+
+DEFAULT_STATE_SIZE = 2
+
+# Compiled models live here unless LINGUISTIC_ALCHEMY_CACHE points elsewhere
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "linguistic-alchemy")
+
+# Compiled models already loaded by this process, by cache key
+_MODELS: Dict[str, "PhonotacticModel"] = {}
+
+
+class PhonotacticModel:
+    """A compiled character n-gram model.
+
+    The transitions of every state sit side by side in flat arrays, each
+    state's block laid out as an alias table (Vose's method). Picking the next
+    character for a whole batch of words is then one uniform draw and a few
+    array lookups, whatever the number of transitions.
+    """
+
+    __slots__ = ("state_size", "offsets", "widths", "threshold", "alias",
+                 "next_state", "code_points", "start")
+
+    def __init__(self, state_size, offsets, widths, threshold, alias, next_state, code_points, start):
+        self.state_size = state_size
+        # Where each state's block starts and how many transitions it holds
+        self.offsets = offsets
+        self.widths = widths
+        # A draw landing in slot i keeps it below threshold[i], else takes alias[i]
+        self.threshold = threshold
+        self.alias = alias
+        # State reached by each transition; -1 once the word has ended
+        self.next_state = next_state
+        # Character emitted by each transition; 0 for the end of the word
+        self.code_points = code_points
+        self.start = start
+
+    @classmethod
+    def train(cls, words: Sequence[str], state_size: int = DEFAULT_STATE_SIZE) -> "PhonotacticModel":
+        """Train a markovify chain on the characters of `words` and compile it"""
+        import markovify
+        import numpy as np
+
+        chain = markovify.Chain([list(word) for word in words if word], state_size)
+        states = list(chain.model)
+        state_ids = {state: i for i, state in enumerate(states)}
+
+        offsets, widths, threshold, alias, next_state, code_points = [], [], [], [], [], []
+        for state in states:
+            transitions = chain.model[state]
+            offset, width = len(threshold), len(transitions)
+            offsets.append(offset)
+            widths.append(width)
+
+            total = sum(transitions.values())
+            scaled = [count * width / total for count in transitions.values()]
+            slot_threshold = [1.0] * width
+            slot_alias = list(range(offset, offset + width))
+            small = [i for i, p in enumerate(scaled) if p < 1.0]
+            large = [i for i, p in enumerate(scaled) if p >= 1.0]
+            while small and large:
+                low, high = small.pop(), large.pop()
+                slot_threshold[low] = scaled[low]
+                slot_alias[low] = offset + high
+                scaled[high] -= 1.0 - scaled[low]
+                (small if scaled[high] < 1.0 else large).append(high)
+            threshold.extend(slot_threshold)
+            alias.extend(slot_alias)
+
+            for token in transitions:
+                if token == markovify.chain.END:
+                    next_state.append(-1)
+                    code_points.append(0)
+                else:
+                    next_state.append(state_ids[state[1:] + (token,)])
+                    code_points.append(ord(token))
+
+        return cls(
+            state_size,
+            np.array(offsets, dtype=np.int64),
+            np.array(widths, dtype=np.int64),
+            np.array(threshold, dtype=np.float64),
+            np.array(alias, dtype=np.int64),
+            np.array(next_state, dtype=np.int64),
+            np.array(code_points, dtype=np.uint32),
+            state_ids[(markovify.chain.BEGIN,) * state_size],
+        )
+
+    def sample(self, count: int, rng, min_length: int = 3, max_length: int = 10):
+        """Draw `count` stems as a NumPy string array using the generator `rng`.
+
+        Stems that come out shorter than `min_length` or run past `max_length`
+        characters are redrawn, so every returned stem is in range.
+        """
+        import numpy as np
+
+        stems = np.empty(count, dtype=f"<U{max_length}")
+        pending = np.arange(count)
+        while len(pending):
+            batch = len(pending)
+            points = np.zeros((batch, max_length + 1), dtype=np.uint32)
+            state = np.full(batch, self.start, dtype=np.int64)
+            # Rows of `points` still being written, shrinking as words end
+            rows = np.arange(batch)
+            for step in range(max_length + 1):
+                scaled = rng.random(len(rows)) * self.widths[state]
+                column = scaled.astype(np.int64)
+                slot = self.offsets[state] + column
+                slot = np.where(scaled - column < self.threshold[slot], slot, self.alias[slot])
+                points[rows, step] = self.code_points[slot]
+                state = self.next_state[slot]
+                going = state >= 0
+                rows, state = rows[going], state[going]
+                if not len(rows):
+                    break
+
+            # A stem still going after max_length + 1 characters is too long
+            lengths = np.count_nonzero(points, axis=1)
+            valid = (lengths >= min_length) & (lengths <= max_length)
+            drawn = np.ascontiguousarray(points[:, :max_length]).view(f"<U{max_length}").ravel()
+            stems[pending[valid]] = drawn[valid]
+            pending = pending[~valid]
+        return stems
+
+    def save(self, path: str):
+        import numpy as np
+
+        # Write beside the target and rename so readers never see a partial file
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as handle:
+            np.savez(
+                handle,
+                state_size=self.state_size,
+                offsets=self.offsets,
+                widths=self.widths,
+                threshold=self.threshold,
+                alias=self.alias,
+                next_state=self.next_state,
+                code_points=self.code_points,
+                start=self.start,
+            )
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "PhonotacticModel":
+        import numpy as np
+
+        with np.load(path) as tables:
+            return cls(
+                int(tables["state_size"]),
+                tables["offsets"],
+                tables["widths"],
+                tables["threshold"],
+                tables["alias"],
+                tables["next_state"],
+                tables["code_points"],
+                int(tables["start"]),
+            )
+
+
+def model_key(words: Sequence[str], state_size: int = DEFAULT_STATE_SIZE) -> str:
+    """Content hash identifying the model trained from `words`"""
+    import hashlib
+
+    payload = json.dumps([state_size, list(words)], ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def get_model(family: str = "elvish", lexicon: List[str] = None,
+              state_size: int = DEFAULT_STATE_SIZE, cache_dir: str = None) -> PhonotacticModel:
+    """Return the compiled model for a family, training it only on a cache miss.
+
+    `lexicon` overrides the family's built-in seed lexicon. The disk cache can
+    be moved with `cache_dir` or the LINGUISTIC_ALCHEMY_CACHE environment
+    variable; if it cannot be written the model is simply kept in memory.
+    """
+    words = lexicon if lexicon is not None else SEED_LEXICONS.get(family, SEED_LEXICONS["elvish"])
+    key = model_key(words, state_size)
+    if key in _MODELS:
+        return _MODELS[key]
+
+    cache_dir = cache_dir or os.environ.get("LINGUISTIC_ALCHEMY_CACHE", DEFAULT_CACHE_DIR)
+    path = os.path.join(cache_dir, f"phonotactic-{key}.npz")
+    try:
+        model = PhonotacticModel.load(path)
+    except (OSError, KeyError, ValueError):
+        model = PhonotacticModel.train(words, state_size)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            model.save(path)
+        except OSError:
+            pass
+
+    _MODELS[key] = model
+    return model
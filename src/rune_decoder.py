@@ -0,0 +1,200 @@
+"""Read rune inscriptions back into a generated language and into English.
+
+generate_rune_script folds 26 letters onto 5 or 6 symbols, so one run of
+runes can spell many words and a token without spaces can split into words
+in many ways. A RuneTrie indexes a language's words by their rune spelling.
+Decoding walks it along each token and keeps only the `beam_width` cheapest
+readings at every position, so the work grows linearly with the length of
+the inscription instead of with the number of possible segmentations.
+"""
+import heapq
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from rune_maker import RuneGenerator
+
+# Edges are keyed by (node << _CHAR_BITS) | code point, which covers all of Unicode
+_CHAR_BITS = 21
+
+
+class RuneTrie:
+    """Words of one language indexed by their rune spelling in one script"""
+    __slots__ = ("script_type", "_edges", "_words", "_nodes", "_size")
+
+    def __init__(self, words: Iterable[str] = (), script_type: str = "runic"):
+        self.script_type = script_type
+        # Child of each (node, character); node 0 is the root
+        self._edges: Dict[int, int] = {}
+        # Words spelled by the path to a node, in the order they were added
+        self._words: Dict[int, List[str]] = {}
+        self._nodes = 1
+        self._size = 0
+
+        words = list(words)
+        # One translate call for the whole list; newlines are left as they are
+        spellings = RuneGenerator().generate_rune_script("\n".join(words), script_type).split("\n")
+        for word, runes in zip(words, spellings):
+            self.add(word, runes)
+
+    def add(self, word: str, runes: str):
+        edges = self._edges
+        node = 0
+        for char in runes:
+            key = node << _CHAR_BITS | ord(char)
+            child = edges.get(key)
+            if child is None:
+                child = edges[key] = self._nodes
+                self._nodes += 1
+            node = child
+        self._words.setdefault(node, []).append(word)
+        self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def lookup(self, runes: str) -> List[str]:
+        """Every word spelled exactly `runes`"""
+        node = 0
+        for char in runes:
+            node = self._edges.get(node << _CHAR_BITS | ord(char))
+            if node is None:
+                return []
+        return self._words.get(node, [])
+
+    def matches(self, runes: str, start: int = 0) -> Iterator[Tuple[int, List[str]]]:
+        """Yield (end, words) for every word spelled by runes[start:end]"""
+        edges, terminals = self._edges, self._words
+        node = 0
+        for end in range(start, len(runes)):
+            node = edges.get(node << _CHAR_BITS | ord(runes[end]))
+            if node is None:
+                return
+            words = terminals.get(node)
+            if words:
+                yield end + 1, words
+
+    def memory_usage(self) -> int:
+        import sys
+
+        return (sys.getsizeof(self._edges) + sys.getsizeof(self._words)
+                + sum(sys.getsizeof(words) for words in self._words.values()))
+
+
+class Reading:
+    """One decoding of an inscription: ancient words and their English, if known"""
+    __slots__ = ("cost", "ancient", "english")
+
+    def __init__(self, cost: float, ancient: Tuple[str, ...], english: Tuple[Optional[str], ...]):
+        self.cost = cost
+        self.ancient = ancient
+        self.english = english
+
+    @property
+    def ancient_text(self) -> str:
+        return " ".join(self.ancient)
+
+    @property
+    def english_text(self) -> str:
+        # Words without a translation are kept as they are, as when translating
+        return " ".join(ancient if english is None else english
+                        for ancient, english in zip(self.ancient, self.english))
+
+    def __repr__(self) -> str:
+        return f"Reading({self.cost:.2f}, {self.ancient_text!r} -> {self.english_text!r})"
+
+
+class RuneDecoder:
+    """Beam-search decoder from one script back to a language and English.
+
+    A reading costs WORD_COST per word, so fewer, longer words win; words
+    with no English translation cost UNTRANSLATED_COST more; a token no
+    sequence of known words spells costs UNKNOWN_COST and is kept as runes.
+    Among words with the same spelling, translated words come first and
+    each later one costs HOMOGRAPH_COST more.
+    """
+
+    WORD_COST = 1.0
+    UNTRANSLATED_COST = 1.0
+    UNKNOWN_COST = 4.0
+    HOMOGRAPH_COST = 0.01
+    # Readings kept at each position of a token
+    BEAM_WIDTH = 8
+
+    def __init__(self, vocabulary_words: Iterable[str], pairs: Iterable[Tuple[str, str]],
+                 script_type: str = "runic", beam_width: int = BEAM_WIDTH):
+        # Inverted translation index: ancient word -> the first English word paired with it
+        self.english: Dict[str, str] = {}
+        for eng, ancient in pairs:
+            self.english.setdefault(ancient, eng)
+        self.beam_width = beam_width
+        # Translated words go in first so they head every homograph list
+        words = dict.fromkeys(self.english)
+        words.update(dict.fromkeys(vocabulary_words))
+        self.trie = RuneTrie(words, script_type)
+
+    @property
+    def script_type(self) -> str:
+        return self.trie.script_type
+
+    def candidates(self, runes: str) -> List[Tuple[str, Optional[str]]]:
+        """(ancient, English) for every word spelled exactly `runes`, best first"""
+        return [(word, self.english.get(word)) for word in self.trie.lookup(runes)]
+
+    def decode(self, inscription: str, top: int = 1, beam_width: int = None) -> List[Reading]:
+        """Return the `top` cheapest readings of a whole inscription"""
+        width = max(beam_width or self.beam_width, top)
+        # (cost, path), a path being a linked list (word, english, rest) newest first
+        beam: List[Tuple[float, Optional[tuple]]] = [(0.0, None)]
+        for token in inscription.split():
+            beam = self._decode_token(beam, token, width)
+
+        readings = []
+        for cost, path in beam[:top]:
+            ancient, english = [], []
+            while path is not None:
+                word, eng, path = path
+                ancient.append(word)
+                english.append(eng)
+            readings.append(Reading(cost, tuple(reversed(ancient)), tuple(reversed(english))))
+        return readings
+
+    def _decode_token(self, beam, token: str, width: int):
+        english = self.english
+        word_cost = self.WORD_COST
+        untranslated_cost = word_cost + self.UNTRANSLATED_COST
+        homograph_cost = self.HOMOGRAPH_COST
+
+        # Candidates ending at each position of the token, as flat
+        # (cost, word, english, path) tuples; only the ones that survive
+        # the beam are linked into paths
+        at: List[list] = [[] for _ in range(len(token) + 1)]
+        for start in range(len(token)):
+            if start:
+                here = at[start]
+                if not here:
+                    continue
+                here = [(cost, (word, eng, path))
+                        for cost, word, eng, path in heapq.nsmallest(width, here, key=_cost)]
+            else:
+                here = beam
+            for end, words in self.trie.matches(token, start):
+                extended = at[end]
+                # No more than `width` homographs can survive the beam
+                for rank, word in enumerate(words[:width]):
+                    eng = english.get(word)
+                    step = (word_cost if eng is not None else untranslated_cost) + rank * homograph_cost
+                    for cost, path in here:
+                        extended.append((cost + step, word, eng, path))
+
+        done = at[len(token)]
+        if not done:
+            return [(cost + self.UNKNOWN_COST, (token, None, path)) for cost, path in beam]
+        return [(cost, (word, eng, path)) for cost, word, eng, path in heapq.nsmallest(width, done, key=_cost)]
+
+    def translate(self, inscription: str) -> str:
+        """English text of the best reading"""
+        readings = self.decode(inscription)
+        return readings[0].english_text if readings else ""
+
+
+def _cost(hypothesis) -> float:
+    return hypothesis[0]
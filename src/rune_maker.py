@@ -1,60 +1,158 @@
+import os
 import random
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+# Unicode blocks for interesting symbols
+SYMBOL_BLOCKS = MappingProxyType({
+    "alchemical": ("\u26B0", "\u26B1", "\u2695", "\u2697", "\u26E8"),
+    "runic": ("\u16A0", "\u16A1", "\u16A2", "\u16A3", "\u16A4", "\u16A5"),
+    "geometric": ("\u25A0", "\u25B2", "\u25C6", "\u25C7", "\u25C8"),
+    "astrological": ("\u2600", "\u2601", "\u2602", "\u2603", "\u2604"),
+})
+
+# Compiled str.translate tables, shared by all generators and keyed by symbol set
+_TRANSLATE_TABLES: Dict[Tuple[str, ...], Dict[int, str]] = {}
+
+
+@lru_cache(maxsize=32)
+def _circle_cells(diameter: int):
+    """Flat row-major indices of the cells inside a circle of the given diameter"""
+    import numpy as np
+
+    # Doubled offsets from the centre keep the distance test in exact integers:
+    # dist < d/2  <=>  (2i - d)^2 + (2j - d)^2 < d^2
+    offsets = 2 * np.arange(diameter, dtype=np.int64) - diameter
+    inside = offsets[:, None] ** 2 + offsets[None, :] ** 2 < diameter ** 2
+    cells = np.flatnonzero(inside)
+    cells.flags.writeable = False
+    return cells
+
+
+@lru_cache(maxsize=32)
+def _ring_cells(diameter: int, rings: int):
+    """Cells of each concentric band, outermost first, read track by track clockwise from the top"""
+    import numpy as np
+
+    offsets = 2 * np.arange(diameter, dtype=np.int64) - diameter
+    rows, cols = offsets[:, None], offsets[None, :]
+    radius = np.sqrt(rows ** 2 + cols ** 2) / diameter  # 0 at the centre, 1 at the rim
+    band = np.minimum((radius * rings).astype(np.int64), rings - 1).ravel()
+    track = -np.floor(radius * diameter / 2).astype(np.int64).ravel()  # one-cell-wide circles
+    angle = np.mod(np.arctan2(cols, -rows), 2 * np.pi).ravel()  # clockwise from twelve o'clock
+
+    layout = []
+    circle = _circle_cells(diameter)
+    for ring in range(rings - 1, -1, -1):
+        cells = circle[band[circle] == ring]
+        cells = cells[np.lexsort((angle[cells], track[cells]))]
+        cells.flags.writeable = False
+        layout.append(cells)
+    return tuple(layout)
+
+
+def _render_cells(diameter: int, cells_and_chars) -> str:
+    """Paint characters into a blank square canvas and decode it in one pass"""
+    import numpy as np
+
+    # Each row carries a trailing newline; the canvas is built as UTF-32 code points
+    canvas = np.full((diameter, diameter + 1), ord(" "), dtype="<u4")
+    canvas[:, diameter] = ord("\n")
+    flat = canvas[:, :diameter]
+    for cells, codes in cells_and_chars:
+        flat[cells // diameter, cells % diameter] = codes
+    return canvas.tobytes().decode("utf-32-le")
+
 
 class RuneGenerator:
+    # Characters read per chunk when streaming a file
+    STREAM_CHUNK_SIZE = 1 << 16
+
+    # Read-only, shared by all instances
+    symbol_blocks = SYMBOL_BLOCKS
+
     def __init__(self, seed=None):
-        if seed:
-            random.seed(seed)
-        
-        # Unicode blocks for interesting symbols
-        self.symbol_blocks = {
-            "alchemical": ["\u26B0", "\u26B1", "\u2695", "\u2697", "\u26E8"],
-            "runic": ["\u16A0", "\u16A1", "\u16A2", "\u16A3", "\u16A4", "\u16A5"],
-            "geometric": ["\u25A0", "\u25B2", "\u25C6", "\u25C7", "\u25C8"],
-            "astrological": ["\u2600", "\u2601", "\u2602", "\u2603", "\u2604"]
-        }
-    
+        self.rng = random.Random(seed)
+
+    def _get_translate_table(self, script_type: str) -> Dict[int, str]:
+        """Return the cached letter-to-symbol table for a script type"""
+        symbols = self.symbol_blocks.get(script_type, self.symbol_blocks["runic"])
+        table = _TRANSLATE_TABLES.get(symbols)
+        if table is None:
+            letters = "abcdefghijklmnopqrstuvwxyz"
+            table = str.maketrans({
+                char: symbols[i % len(symbols)] for i, char in enumerate(letters)
+            })
+            _TRANSLATE_TABLES[symbols] = table
+        return table
+
     def generate_rune_script(self, text: str, script_type: str = "runic") -> str:
         """Convert text to a runic representation"""
-        # Create mapping from letters to symbols
-        symbols = self.symbol_blocks.get(script_type, self.symbol_blocks["runic"])
-        symbol_mapping = {}
-        
-        letters = "abcdefghijklmnopqrstuvwxyz"
-        for i, char in enumerate(letters):
-            symbol_mapping[char] = symbols[i % len(symbols)]
-        
-        # Convert text to runes
-        runic_text = ""
-        for char in text.lower():
-            if char in symbol_mapping:
-                runic_text += symbol_mapping[char]
-            else:
-                runic_text += char
-        
-        return runic_text
+        return text.lower().translate(self._get_translate_table(script_type))
+
+    def stream_rune_script(self, source: Union[str, os.PathLike, Iterable[str]],
+                           script_type: str = "runic") -> Iterator[str]:
+        """Convert a file path or an iterable of text chunks to runes, yielding chunk by chunk"""
+        table = self._get_translate_table(script_type)
+
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, encoding="utf-8") as handle:
+                for chunk in iter(lambda: handle.read(self.STREAM_CHUNK_SIZE), ""):
+                    yield chunk.lower().translate(table)
+        else:
+            for chunk in source:
+                yield chunk.lower().translate(table)
+
+    def write_rune_script(self, source: Union[str, os.PathLike, Iterable[str]],
+                          destination: Union[str, os.PathLike],
+                          script_type: str = "runic") -> int:
+        """Stream a runic conversion into a file and return the number of characters written"""
+        written = 0
+        with open(destination, "w", encoding="utf-8") as handle:
+            for chunk in self.stream_rune_script(source, script_type):
+                handle.write(chunk)
+                written += len(chunk)
+        return written
     
     def generate_rune_circle(self, phrase: str, diameter: int = 5) -> str:
         """Generate a circular rune inscription (ASCII art)"""
-        circle = ""
-        chars = list(phrase.replace(" ", ""))
-        
+        import numpy as np
+
+        chars = phrase.replace(" ", "")
         if not chars:
             return "O"
-        
-        # Simple circular pattern
-        for i in range(diameter):
-            line = ""
-            for j in range(diameter):
-                # Calculate position in circular pattern
-                dist_from_center = ((i - diameter/2)**2 + (j - diameter/2)**2)**0.5
-                if dist_from_center < diameter/2:
-                    idx = int((i * diameter + j) % len(chars))
-                    line += chars[idx]
-                else:
-                    line += " "
-            circle += line + "\n"
-        
-        return circle
+        if diameter <= 0:
+            return ""
+
+        # Cells inside the circle cycle through the phrase by row-major position
+        cells = _circle_cells(diameter)
+        codes = np.array([ord(char) for char in chars], dtype="<u4")
+        return _render_cells(diameter, [(cells, codes[cells % len(codes)])])
+
+    def generate_rune_rings(self, phrase: str, diameter: int = 25, rings: int = 3) -> str:
+        """Lay a long phrase out over concentric rings, one group of words per ring"""
+        import numpy as np
+
+        words = phrase.split()
+        if not words:
+            return "O"
+        if diameter <= 0:
+            return ""
+
+        rings = max(1, min(rings, len(words)))
+        layout = _ring_cells(diameter, rings)
+
+        # Split the words into `rings` contiguous groups, outermost ring first
+        per_ring, extra = divmod(len(words), rings)
+        painted, start = [], 0
+        for ring, cells in enumerate(layout):
+            end = start + per_ring + (1 if ring < extra else 0)
+            codes = np.array([ord(char) for char in "".join(words[start:end])], dtype="<u4")
+            painted.append((cells, codes[np.arange(len(cells)) % len(codes)]))
+            start = end
+
+        return _render_cells(diameter, painted)
     
     def generate_magic_sigil(self, intent: str) -> str:
         """Generate a magical sigil based on intent words"""
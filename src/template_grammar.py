@@ -0,0 +1,47 @@
+import random
+import re
+from typing import Dict, List, Sequence, Tuple, Union
+
+# Symbols are written Tracery-style as #name# inside a template
+_SYMBOL_PATTERN = re.compile(r"#(\w+)#")
+
+# A parsed template: the literal pieces and the symbols between them
+CompiledTemplate = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+
+def compile_template(template: str) -> CompiledTemplate:
+    """Split a template into literal text and the symbol names embedded in it"""
+    parts = _SYMBOL_PATTERN.split(template)
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+class TemplateGrammar:
+    """Tracery-style expansion rules, parsed once and expanded lazily"""
+
+    def __init__(self, rules: Dict[str, Sequence[str]]):
+        self.rules: Dict[str, List[CompiledTemplate]] = {
+            name: [compile_template(option) for option in options]
+            for name, options in rules.items()
+        }
+
+    def expand(self, symbol: str = "origin",
+               context: Dict[str, Union[str, Sequence[str]]] = None,
+               rng: random.Random = None) -> str:
+        """Expand a symbol, choosing only the alternatives that are actually reached"""
+        rng = rng or random
+        context = context or {}
+
+        # Context bindings override rules; a plain string is used verbatim
+        if symbol in context:
+            value = context[symbol]
+            return value if isinstance(value, str) else rng.choice(value)
+
+        literals, symbols = rng.choice(self.rules[symbol])
+        if not symbols:
+            return literals[0]
+
+        pieces = [literals[0]]
+        for name, literal in zip(symbols, literals[1:]):
+            pieces.append(self.expand(name, context, rng))
+            pieces.append(literal)
+        return "".join(pieces)
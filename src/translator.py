@@ -1,55 +1,200 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from dictionary_builder import TranslationDictionary, build_dictionary
+from inscription import IncrementalTranslator, InscriptionPipeline
+from rune_decoder import Reading, RuneDecoder
+from vocabulary import LazyVocabulary
+
+
+class TranslationIndex:
+    """Compiled lookup tables over one language's translation pairs"""
+
+    # Substrings longer than this are not indexed; lookups for longer words
+    # fall back to a scan over the pairs (memoized per word).
+    MAX_INDEXED_SUBSTRING = 16
+
+    def __init__(self, pairs: List[Tuple[str, str]]):
+        self.pairs = pairs
+        self.size = len(pairs)
+        self.exact: Dict[str, str] = {}
+        self.partial: Dict[str, str] = {}
+        self._long_words: Dict[str, Optional[str]] = {}
+
+        # Pairs are visited in order and setdefault keeps the first hit, so a
+        # substring maps to the first pair whose English side contains it -
+        # the same answer the old linear `word in eng` scan produced.
+        limit = self.MAX_INDEXED_SUBSTRING
+        for eng, ancient in pairs:
+            self.exact.setdefault(eng, ancient)
+            n = len(eng)
+            for start in range(n):
+                for end in range(start + 1, min(n, start + limit) + 1):
+                    self.partial.setdefault(eng[start:end], ancient)
+
+    def is_stale(self, pairs: List[Tuple[str, str]]) -> bool:
+        """Check whether the index no longer reflects the given pair list"""
+        return pairs is not self.pairs or len(pairs) != self.size
+
+    def lookup(self, word: str) -> Optional[str]:
+        """Find the ancient word for the first pair whose English side contains `word`"""
+        if len(word) <= self.MAX_INDEXED_SUBSTRING:
+            return self.partial.get(word)
+
+        if word not in self._long_words:
+            self._long_words[word] = next(
+                (ancient for eng, ancient in self.pairs if word in eng), None
+            )
+        return self._long_words[word]
+
+    def lookup_exact(self, word: str) -> Optional[str]:
+        """Find the ancient word paired with exactly `word`"""
+        return self.exact.get(word)
+
+
 class LinguisticTranslator:
     def __init__(self, language_generator):
         self.lg = language_generator
         self.translation_models = {}
+        self._indexes: Dict[str, TranslationIndex] = {}
+        # (language, script, template) -> pipeline bound to the language's current index
+        self._pipelines: Dict[Tuple[str, str, str], InscriptionPipeline] = {}
+        # (language, script, template) -> line cache bound to that pipeline
+        self._incremental: Dict[Tuple[str, str, str], IncrementalTranslator] = {}
+        # (language, script) -> (index, vocabulary, vocabulary size, decoder)
+        self._decoders: Dict[Tuple[str, str], tuple] = {}
     
     def create_translation_system(self, language_name: str, english_corpus: list):
         """Create a simple translation model between English and the generated language"""
         # This is a simplified approach - in reality you'd use proper ML
         lang = self.lg.languages[language_name]
-        translation_pairs = []
         
-        # Create some basic translation pairs based on word categories
-        for i, word in enumerate(lang['vocabulary'].keys()):
-            if i < len(english_corpus):
-                translation_pairs.append((english_corpus[i], word))
+        # Create some basic translation pairs based on word categories; zip
+        # stops at the corpus size instead of walking the whole vocabulary
+        translation_pairs = list(zip(english_corpus, lang['vocabulary']))
         
         self.translation_models[language_name] = translation_pairs
+        self._indexes[language_name] = TranslationIndex(translation_pairs)
         return translation_pairs
+
+    def create_translation_system_from_lexicon(self, language_name: str, lexicon, path=None,
+                                               seed=None) -> TranslationDictionary:
+        """Pair a streamed English lexicon (word<TAB>pos per line) with the language by category.
+
+        The language's vocabulary grows when a category runs out of words.
+        With `path` the dictionary is also saved for load_dictionary().
+        """
+        dictionary = build_dictionary(self.lg, language_name, lexicon, path, seed)
+        self._use_dictionary(language_name, dictionary)
+        return dictionary
+
+    def load_dictionary(self, path, language_name: str = None) -> TranslationDictionary:
+        """Use a saved dictionary as the translation model, without rebuilding it"""
+        dictionary = TranslationDictionary.load(path)
+        self._use_dictionary(language_name or dictionary.language_name, dictionary)
+        return dictionary
+
+    def _use_dictionary(self, language_name: str, dictionary: TranslationDictionary):
+        # A dictionary is both the pair list and its own index
+        self.translation_models[language_name] = dictionary
+        self._indexes[language_name] = dictionary
+
+    def get_index(self, language_name: str) -> TranslationIndex:
+        """Return the compiled index for a language, rebuilding it if the pairs changed"""
+        if language_name not in self.translation_models:
+            raise ValueError(f"No translation model for {language_name}")
+
+        pairs = self.translation_models[language_name]
+        index = self._indexes.get(language_name)
+        if index is None or index.is_stale(pairs):
+            index = TranslationIndex(pairs)
+            self._indexes[language_name] = index
+        return index
     
     def translate_to_ancient(self, english_text: str, language_name: str) -> str:
         """Translate English text to the ancient language"""
-        if language_name not in self.translation_models:
-            raise ValueError(f"No translation model for {language_name}")
+        index = self.get_index(language_name)
         
         # Simple word-by-word translation (this would be more complex IRL)
-        words = english_text.lower().split()
         translated_words = []
-        
-        for word in words:
-            # Find the best match in translation pairs
-            found = False
-            for eng, ancient in self.translation_models[language_name]:
-                if word in eng:
-                    translated_words.append(ancient)
-                    found = True
-                    break
-            
-            if not found:
-                translated_words.append(word)  # Keep untranslated
+        for word in english_text.lower().split():
+            ancient = index.lookup(word)
+            translated_words.append(word if ancient is None else ancient)  # Keep untranslated
         
         return " ".join(translated_words)
+
+    def translate_many(self, texts: Iterable[str], language_name: str) -> List[str]:
+        """Translate a batch of English lines, resolving each distinct word only once"""
+        index = self.get_index(language_name)
+        resolved: Dict[str, str] = {}
+        results = []
+
+        for text in texts:
+            translated_words = []
+            for word in text.lower().split():
+                ancient = resolved.get(word)
+                if ancient is None:
+                    ancient = index.lookup(word)
+                    if ancient is None:
+                        ancient = word
+                    resolved[word] = ancient
+                translated_words.append(ancient)
+            results.append(" ".join(translated_words))
+
+        return results
     
+    def inscription_pipeline(self, language_name: str, script_type: str = "runic",
+                             template: str = "inscription") -> InscriptionPipeline:
+        """Return the reusable inscription pipeline for a language, script and layout"""
+        index = self.get_index(language_name)
+        key = (language_name, script_type, template)
+        pipeline = self._pipelines.get(key)
+        if pipeline is None or pipeline.index is not index:
+            pipeline = InscriptionPipeline(index, language_name, script_type, template)
+            self._pipelines[key] = pipeline
+        return pipeline
+
     def create_bilingual_inscription(self, text: str, language_name: str) -> str:
         """Create a side-by-side translation"""
-        from rune_maker import RuneGenerator
-        rune_gen = RuneGenerator()
-        
-        ancient_text = self.translate_to_ancient(text, language_name)
-        runic_text = rune_gen.generate_rune_script(ancient_text)
-        
-        return f"""
-English: {text}
-{language_name}: {ancient_text}
-Runic: {runic_text}
-        """
\ No newline at end of file
+        return self.inscription_pipeline(language_name).render(text)
+
+    def incremental_translator(self, language_name: str, script_type: str = "runic",
+                               template: str = "inscription") -> IncrementalTranslator:
+        """Return the line cache for live re-translation, emptied whenever the language's index changes"""
+        pipeline = self.inscription_pipeline(language_name, script_type, template)
+        key = (language_name, script_type, template)
+        live = self._incremental.get(key)
+        if live is None or live.pipeline is not pipeline:
+            live = IncrementalTranslator(pipeline)
+            self._incremental[key] = live
+        return live
+
+    def translate_incremental(self, text: str, language_name: str) -> Tuple[str, str]:
+        """translate_to_ancient and create_bilingual_inscription for a text, reusing unchanged lines"""
+        live = self.incremental_translator(language_name)
+        ancient, runic = live.update(text)
+        return ancient, live.pipeline.format(text, ancient, runic)
+
+    def rune_decoder(self, language_name: str, script_type: str = "runic") -> RuneDecoder:
+        """Return the decoder from a script back to a language, rebuilding it if the language changed"""
+        index = self.get_index(language_name)
+        vocabulary = self.lg.languages[language_name]["vocabulary"]
+        # A lazy vocabulary may be unbounded; only its translated words are indexed
+        lazy = isinstance(vocabulary, LazyVocabulary)
+        signature = (index, vocabulary, None if lazy else (len(vocabulary), getattr(vocabulary, "version", None)))
+        key = (language_name, script_type)
+        cached = self._decoders.get(key)
+        if cached is not None and cached[0] is index and cached[1] is vocabulary and cached[2] == signature[2]:
+            return cached[3]
+
+        decoder = RuneDecoder(() if lazy else vocabulary, self.translation_models[language_name], script_type)
+        self._decoders[key] = signature + (decoder,)
+        return decoder
+
+    def decode_runes(self, rune_text: str, language_name: str, script_type: str = "runic",
+                     top: int = 3) -> List[Reading]:
+        """Candidate readings of a rune inscription, cheapest first"""
+        return self.rune_decoder(language_name, script_type).decode(rune_text, top)
+
+    def translate_from_runes(self, rune_text: str, language_name: str, script_type: str = "runic") -> str:
+        """Translate a rune inscription back to English through its best reading"""
+        return self.rune_decoder(language_name, script_type).translate(rune_text)
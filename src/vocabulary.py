@@ -0,0 +1,743 @@
+import re
+import sys
+import zlib
+from array import array
+from collections import OrderedDict
+from itertools import accumulate, count
+from collections.abc import ItemsView, Mapping, MutableMapping
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+# Category code marking a deleted entry
+_DELETED = 255
+
+# Smallest hash table allocated, in slots
+_MIN_TABLE_SIZE = 8
+
+
+class Vocabulary(MutableMapping):
+    """Word -> category mapping packed into flat buffers.
+
+    Words are UTF-8 encoded back to back in one buffer with an offset array,
+    categories are interned and stored as one byte per word, and lookups go
+    through an open-addressing table of word indices keyed by CRC-32.
+    Insertion order is preserved like a dict. The buffers may also be
+    read-only memoryviews (e.g. over an mmap); they are copied into owned
+    arrays on the first mutation.
+    """
+    __slots__ = ("_words", "_offsets", "_codes", "_categories", "_category_codes",
+                 "_table", "_mask", "_size", "_version", "_slices", "_frozen")
+
+    def __init__(self, mapping: Mapping = None):
+        self._words = bytearray()
+        self._offsets = array("I", [0])
+        self._codes = array("B")
+        self._categories: List[str] = []
+        self._category_codes: Dict[str, int] = {}
+        self._table = array("i", [-1]) * _MIN_TABLE_SIZE
+        self._mask = _MIN_TABLE_SIZE - 1
+        self._size = 0
+        self._version = 0
+        self._slices: Dict[str, Tuple[int, List[str]]] = {}
+        self._frozen = False
+        if mapping:
+            self.update_pairs(mapping.items())
+
+    @classmethod
+    def from_buffers(cls, words, offsets, codes, table, categories: List[str]) -> "Vocabulary":
+        """Wrap existing packed buffers, such as memoryviews over a mapped file, without copying"""
+        vocabulary = cls()
+        vocabulary._words = words
+        vocabulary._offsets = offsets
+        vocabulary._codes = codes
+        vocabulary._table = table
+        vocabulary._mask = len(table) - 1
+        vocabulary._categories = [sys.intern(name) for name in categories]
+        vocabulary._category_codes = {name: code for code, name in enumerate(vocabulary._categories)}
+        vocabulary._size = len(codes) - codes.tobytes().count(bytes([_DELETED]))
+        return vocabulary
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[str, str]]) -> "Vocabulary":
+        """Build a vocabulary from (word, category) pairs"""
+        vocabulary = cls()
+        vocabulary.update_pairs(pairs)
+        return vocabulary
+
+    def update_pairs(self, pairs: Iterable[Tuple[str, str]]):
+        """Add or re-categorise many words at once"""
+        if self._codes or self._frozen:
+            self._own()
+            merged = dict(pairs)
+            # Size the table once for the whole batch instead of doubling as it fills
+            if (len(self._codes) + len(merged)) * 2 > len(self._table):
+                self._rebuild_table(len(self._codes) + len(merged))
+            words, offsets, codes, table = self._words, self._offsets, self._codes, self._table
+            for word, category in merged.items():
+                data = word.encode("utf-8")
+                code = self._category_code(category)
+                index, slot = self._find(data)
+                if index >= 0 and codes[index] != _DELETED:
+                    codes[index] = code
+                    continue
+                table[slot] = len(codes)
+                words += data
+                offsets.append(len(words))
+                codes.append(code)
+                self._size += 1
+            self._version += 1
+            return
+
+        # Empty vocabulary: pack everything in one go and hash each word once
+        merged = dict(pairs)
+        encoded = [word.encode("utf-8") for word in merged]
+        self._words = bytearray(b"".join(encoded))
+        self._offsets = array("I", accumulate(map(len, encoded), initial=0))
+        self._codes = array("B", map(self._category_code, merged.values()))
+        self._size = len(encoded)
+        self._version += 1
+        self._rebuild_table(len(encoded), encoded)
+
+    # -- internals ---------------------------------------------------------
+
+    def _word_bytes(self, index: int) -> bytes:
+        offsets = self._offsets
+        return bytes(self._words[offsets[index]:offsets[index + 1]])
+
+    def _word(self, index: int) -> str:
+        offsets = self._offsets
+        return str(self._words[offsets[index]:offsets[index + 1]], "utf-8")
+
+    def _find(self, data: bytes) -> Tuple[int, int]:
+        """Return (entry index or -1, table slot) for an encoded word"""
+        table, mask, offsets, words = self._table, self._mask, self._offsets, self._words
+        slot = zlib.crc32(data) & mask
+        while True:
+            index = table[slot]
+            if index < 0 or words[offsets[index]:offsets[index + 1]] == data:
+                return index, slot
+            slot = (slot + 1) & mask
+
+    def _own(self):
+        """Copy borrowed read-only buffers into mutable arrays before a write"""
+        if self._frozen:
+            raise TypeError("Vocabulary is frozen")
+        if isinstance(self._words, memoryview):
+            self._words = bytearray(self._words)
+            self._offsets = array("I", self._offsets.tobytes())
+            self._codes = array("B", self._codes.tobytes())
+            self._table = array("i", self._table.tobytes())
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_codes.get(category)
+        if code is None:
+            code = len(self._categories)
+            if code >= _DELETED:
+                raise ValueError("Vocabulary supports at most 255 categories")
+            self._categories.append(sys.intern(category))
+            self._category_codes[category] = code
+        return code
+
+    def _rebuild_table(self, capacity: int, encoded: List[bytes] = None):
+        size = _MIN_TABLE_SIZE
+        while size < capacity * 2:
+            size *= 2
+        table = array("i", [-1]) * size
+        mask = size - 1
+        if encoded is None:
+            offsets, words = self._offsets, self._words
+            encoded = [words[offsets[i]:offsets[i + 1]] for i in range(len(self._codes))]
+        crc32 = zlib.crc32
+        for index, (data, code) in enumerate(zip(encoded, self._codes)):
+            if code == _DELETED:
+                continue
+            slot = crc32(data) & mask
+            while table[slot] >= 0:
+                slot = (slot + 1) & mask
+            table[slot] = index
+        self._table, self._mask = table, mask
+
+    def compact(self):
+        """Drop deleted entries from the buffers"""
+        self._own()
+        live = [(self._word_bytes(i), code) for i, code in enumerate(self._codes) if code != _DELETED]
+        self._words = bytearray(b"".join(data for data, _ in live))
+        offsets = array("I", [0])
+        position = 0
+        for data, _ in live:
+            position += len(data)
+            offsets.append(position)
+        self._offsets = offsets
+        self._codes = array("B", (code for _, code in live))
+        self._rebuild_table(len(live))
+        self._version += 1
+
+    # -- mapping interface -------------------------------------------------
+
+    def __getitem__(self, word: str) -> str:
+        index, _ = self._find(word.encode("utf-8"))
+        if index < 0 or self._codes[index] == _DELETED:
+            raise KeyError(word)
+        return self._categories[self._codes[index]]
+
+    def __contains__(self, word) -> bool:
+        if not isinstance(word, str):
+            return False
+        index, _ = self._find(word.encode("utf-8"))
+        return index >= 0 and self._codes[index] != _DELETED
+
+    def __setitem__(self, word: str, category: str):
+        self._own()
+        data = word.encode("utf-8")
+        code = self._category_code(category)
+        index, slot = self._find(data)
+        self._version += 1
+
+        if index >= 0 and self._codes[index] != _DELETED:
+            self._codes[index] = code
+            return
+
+        # New word, or a deleted one coming back: append it at the end
+        new_index = len(self._codes)
+        self._words += data
+        self._offsets.append(len(self._words))
+        self._codes.append(code)
+        self._table[slot] = new_index
+        self._size += 1
+
+        if len(self._codes) * 2 > len(self._table):
+            self._rebuild_table(len(self._codes))
+
+    def __delitem__(self, word: str):
+        index, _ = self._find(word.encode("utf-8"))
+        if index < 0 or self._codes[index] == _DELETED:
+            raise KeyError(word)
+        self._own()
+        self._codes[index] = _DELETED
+        self._size -= 1
+        self._version += 1
+
+        if len(self._codes) > 1024 and self._size * 2 < len(self._codes):
+            self.compact()
+
+    def __iter__(self) -> Iterator[str]:
+        for index, code in enumerate(self._codes):
+            if code != _DELETED:
+                yield self._word(index)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"Vocabulary({self._size} words, {self.memory_usage()} bytes)"
+
+    def items(self):
+        return _VocabularyItems(self)
+
+    def _iter_items(self) -> Iterator[Tuple[str, str]]:
+        categories = self._categories
+        for index, code in enumerate(self._codes):
+            if code != _DELETED:
+                yield self._word(index), categories[code]
+
+    def __getstate__(self):
+        return (bytes(self._words), self._offsets.tobytes(), self._codes.tobytes(),
+                self._categories, self._size)
+
+    def __setstate__(self, state):
+        words, offsets, codes, self._categories, self._size = state
+        self._words = bytearray(words)
+        self._offsets = array("I", offsets)
+        self._codes = array("B", codes)
+        self._category_codes = {name: code for code, name in enumerate(self._categories)}
+        self._version = 0
+        self._slices = {}
+        self._frozen = False
+        self._rebuild_table(len(self._codes))
+
+    # -- extras ------------------------------------------------------------
+
+    def word_at(self, index: int) -> str:
+        """Return the word at buffer position `index`"""
+        return self._word(index)
+
+    def position(self, word: str) -> int:
+        """Return the buffer position of `word`; stable until the next compact()"""
+        index, _ = self._find(word.encode("utf-8"))
+        if index < 0 or self._codes[index] == _DELETED:
+            raise KeyError(word)
+        return index
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every mutation, for callers caching derived data"""
+        return self._version
+
+    def freeze(self) -> "Vocabulary":
+        """Reject all further mutation, e.g. before sharing between sessions"""
+        self._frozen = True
+        return self
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._frozen
+
+    @property
+    def is_mapped(self) -> bool:
+        """True while the buffers are borrowed, e.g. from a memory-mapped file"""
+        return isinstance(self._words, memoryview)
+
+    def packed_buffers(self):
+        """Return (words, offsets, codes, table) as bytes-like objects, compacting first"""
+        if len(self._codes) != self._size and not self._frozen:
+            self.compact()
+        return self._words, self._offsets, self._codes, self._table
+
+    @property
+    def categories(self) -> List[str]:
+        """Interned category names in order of first use"""
+        return list(self._categories)
+
+    def words_in(self, category: str) -> List[str]:
+        """Return the words of one category in insertion order"""
+        cached = self._slices.get(category)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+
+        code = self._category_codes.get(category)
+        words = []
+        if code is not None:
+            # Scan the one-byte category codes in C rather than per word in Python
+            pattern = re.compile(re.escape(bytes([code])))
+            words = [self._word(match.start()) for match in pattern.finditer(self._codes.tobytes())]
+        self._slices[category] = (self._version, words)
+        return words
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the packed buffers and lookup table"""
+        return (
+            len(self._words)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._codes.itemsize * len(self._codes)
+            + self._table.itemsize * len(self._table)
+        )
+
+
+class _VocabularyItems(ItemsView):
+    """Items view that yields from the mapping's `_iter_items` instead of one lookup per key"""
+    __slots__ = ()
+
+    def __iter__(self):
+        return self._mapping._iter_items()
+
+
+class OverlayVocabulary(MutableMapping):
+    """A vocabulary stored as a delta (added, re-categorised and removed words) over a parent.
+
+    The parent is never modified through an overlay. It may still grow or
+    change underneath: the overlay then recounts its size on the next len(),
+    and its version moves with the parent's so caches keyed on it go stale.
+    Lookups cost one dict probe per level.
+    """
+    __slots__ = ("parent", "added", "removed", "_size", "_parent_state", "_version")
+
+    def __init__(self, parent: Mapping, added: Dict[str, str] = None, removed: Set[str] = None):
+        self.parent = parent
+        # Words set in this overlay, in insertion order
+        self.added: Dict[str, str] = dict(added or {})
+        # Parent words hidden by this overlay
+        self.removed: Set[str] = set(removed or ())
+        self._version = 0
+        self._parent_state = self._state_of_parent()
+        self._size = self._count()
+
+    def _state_of_parent(self):
+        return len(self.parent), getattr(self.parent, "version", None)
+
+    def _count(self) -> int:
+        parent, removed = self.parent, self.removed
+        return (len(parent) - sum(1 for word in removed if word in parent)
+                + sum(1 for word in self.added if word in removed or word not in parent))
+
+    def _in_parent(self, word: str) -> bool:
+        return word not in self.removed and word in self.parent
+
+    def __getitem__(self, word: str) -> str:
+        if word in self.added:
+            return self.added[word]
+        if word in self.removed:
+            raise KeyError(word)
+        return self.parent[word]
+
+    def __contains__(self, word) -> bool:
+        return word in self.added or self._in_parent(word)
+
+    def __setitem__(self, word: str, category: str):
+        if word not in self:
+            self._size += 1
+        self.added[word] = category
+        self._version += 1
+
+    def __delitem__(self, word: str):
+        if word not in self:
+            raise KeyError(word)
+        self.added.pop(word, None)
+        if word in self.parent:
+            self.removed.add(word)
+        self._size -= 1
+        self._version += 1
+
+    def __iter__(self) -> Iterator[str]:
+        # Surviving parent words keep their position; words that are new (or
+        # were removed and added back) follow in the order they were set
+        removed = self.removed
+        for word in self.parent:
+            if word not in removed:
+                yield word
+        parent = self.parent
+        for word in self.added:
+            if word in removed or word not in parent:
+                yield word
+
+    def __len__(self) -> int:
+        state = self._state_of_parent()
+        if state != self._parent_state:
+            # The parent changed since the size was last counted
+            self._parent_state = state
+            self._size = self._count()
+        return self._size
+
+    def __repr__(self) -> str:
+        return (f"OverlayVocabulary({len(self)} words, +{len(self.added)} "
+                f"-{len(self.removed)} over {len(self.parent)})")
+
+    @property
+    def version(self) -> int:
+        """Counter that moves on every change to this overlay or the vocabularies below it"""
+        # Both terms only grow, so any change anywhere gives a new sum
+        return self._version + getattr(self.parent, "version", 0)
+
+    def rename(self, word: str, new_word: str):
+        """Replace `word` with `new_word`, keeping its category"""
+        category = self[word]
+        del self[word]
+        self[new_word] = category
+
+    @property
+    def delta_size(self) -> int:
+        """Number of entries this overlay stores itself"""
+        return len(self.added) + len(self.removed)
+
+    def materialize(self) -> Dict[str, str]:
+        """Return a plain dict copy of the visible vocabulary"""
+        return dict(self.items())
+
+
+# Lazy indices are permuted within tiers [2**k, 2**(k+1)), the first tier
+# being [0, _FIRST_TIER), so small vocabularies keep short words
+_FIRST_TIER = 16
+_FEISTEL_ROUNDS = 4
+
+# Out of every 10 codes, this many are bare stems; the rest carry an affix
+_PLAIN_CODES = 3
+
+# Concepts hash into the first 2**32 indices of an unbounded lazy language:
+# wide enough that clashes are rare (about n**2 / 2**33 for n concepts),
+# narrow enough that their words stay pronounceable
+_CONCEPT_SPACE = 1 << 32
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(value: int) -> int:
+    """SplitMix64 finalizer: a fast, stable 64-bit integer hash"""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def _is_uniquely_decodable(codewords: Sequence[str]) -> bool:
+    """Sardinas-Patterson test: can every concatenation be split back in only one way?"""
+    codewords = set(codewords)
+
+    def dangling(prefixes, words):
+        return {w[len(p):] for p in prefixes for w in words if len(w) > len(p) and w.startswith(p)}
+
+    suffixes = dangling(codewords, codewords)
+    seen: Set[str] = set()
+    while suffixes - seen:
+        if suffixes & codewords:
+            return False
+        seen |= suffixes
+        suffixes = dangling(codewords, suffixes) | dangling(suffixes, codewords)
+    return True
+
+
+class LazyVocabulary(Mapping):
+    """Read-only word -> category mapping whose words are derived on demand.
+
+    The word at index i is a pure function of (seed, i): the index goes
+    through a seeded Feistel permutation within its size tier, and the
+    permuted code is spelled as a stem of phonemes (bijective base-N),
+    either bare or with one affix picked by hashing the stem. Every step is
+    invertible, so distinct indices never share a word and a word can be
+    decoded back to its index and category without any stored table. Only
+    recently touched words are kept, in a bounded LRU.
+
+    With `size=None` the language is unbounded: iteration never ends and
+    `len()` raises TypeError.
+    """
+    __slots__ = ("phonemes", "affixes", "seed", "size", "cache_size", "hits", "misses",
+                 "_key", "_separator", "_phoneme_ids", "_categories", "_words")
+
+    def __init__(self, phonemes: Sequence[str], affixes: Dict[str, List[str]], seed,
+                 size: Optional[int] = None, cache_size: int = 4096):
+        self.phonemes = list(phonemes)
+        self.affixes = {category: list(options) for category, options in affixes.items()}
+        self.seed = seed
+        self.size = size
+        self.cache_size = cache_size
+        self.hits = self.misses = 0
+
+        import hashlib
+
+        self._key = int.from_bytes(hashlib.blake2b(repr(seed).encode("utf-8"), digest_size=8).digest(), "little")
+        # Phonemes that could be split two ways are joined with an apostrophe instead
+        self._separator = "" if _is_uniquely_decodable(self.phonemes) else "'"
+        self._phoneme_ids = {phoneme: i for i, phoneme in enumerate(self.phonemes)}
+        self._categories = list(self.affixes)
+        if not all(self.affixes.values()):
+            raise ValueError("Every category needs at least one affix")
+
+        # A prefix and a suffix that both read as stems could spell one word two ways
+        prefixes = [a[:-1] for options in self.affixes.values() for a in options if a.endswith("-")]
+        suffixes = [a[1:] for options in self.affixes.values() for a in options if a.startswith("-")]
+        if (any(self._stem_number(body) is not None for body in prefixes)
+                and any(self._stem_number(body) is not None for body in suffixes)):
+            raise ValueError("Affixes can be read as stems; lazy words would be ambiguous")
+
+        self._words: "OrderedDict[int, Tuple[str, str]]" = OrderedDict()
+
+    # Index <-> code: a Feistel network within each tier, cycle-walking
+    # from the enclosing even-bit domain back into the tier
+
+    def _tier(self, value: int) -> Tuple[int, int]:
+        if value < _FIRST_TIER:
+            return 0, _FIRST_TIER
+        base = 1 << (value.bit_length() - 1)
+        return base, base
+
+    def _feistel(self, value: int, base: int, half_bits: int, inverse: bool) -> int:
+        mask = (1 << half_bits) - 1
+        left, right = value >> half_bits, value & mask
+        steps = reversed(range(_FEISTEL_ROUNDS)) if inverse else range(_FEISTEL_ROUNDS)
+        for step in steps:
+            if inverse:
+                left, right = right ^ (_mix64(self._key ^ (base << 8) ^ (step << 4) ^ left) & mask), left
+            else:
+                left, right = right, left ^ (_mix64(self._key ^ (base << 8) ^ (step << 4) ^ right) & mask)
+        return (left << half_bits) | right
+
+    def _walk(self, value: int, inverse: bool) -> int:
+        base, size = self._tier(value)
+        half_bits = ((size - 1).bit_length() + 1) // 2
+        value -= base
+        while True:
+            value = self._feistel(value, base, half_bits, inverse)
+            if value < size:
+                return base + value
+
+    def _permute(self, index: int) -> int:
+        return self._walk(index, inverse=False)
+
+    def _unpermute(self, code: int) -> int:
+        return self._walk(code, inverse=True)
+
+    # Code <-> word
+
+    def _stem(self, number: int) -> str:
+        base = len(self.phonemes)
+        number += 1
+        digits = []
+        while number:
+            number, digit = divmod(number - 1, base)
+            digits.append(self.phonemes[digit])
+        return self._separator.join(reversed(digits))
+
+    def _stem_number(self, stem: str) -> Optional[int]:
+        if self._separator:
+            parts = stem.split(self._separator)
+            if not all(part in self._phoneme_ids for part in parts):
+                return None
+            digits = [self._phoneme_ids[part] for part in parts]
+        else:
+            # The phonemes are uniquely decodable, so the first parse found is the only one
+            length = len(stem)
+            back: List[Optional[Tuple[int, int]]] = [None] * (length + 1)
+            reached = [True] + [False] * length
+            for start in range(length):
+                if not reached[start]:
+                    continue
+                for phoneme, digit in self._phoneme_ids.items():
+                    end = start + len(phoneme)
+                    if stem.startswith(phoneme, start) and not reached[end]:
+                        reached[end] = True
+                        back[end] = (start, digit)
+            if not stem or not reached[length]:
+                return None
+            digits = []
+            position = length
+            while position:
+                position, digit = back[position]
+                digits.append(digit)
+            digits.reverse()
+
+        number = 0
+        for digit in digits:
+            number = number * len(self.phonemes) + digit + 1
+        return number - 1
+
+    def _affix(self, number: int) -> Tuple[str, str]:
+        """Category and affix that the affixed form of stem `number` takes"""
+        category = self._categories[_mix64(self._key ^ number) % len(self._categories)]
+        options = self.affixes[category]
+        return category, options[_mix64(self._key + number) % len(options)]
+
+    def _spell(self, code: int) -> Tuple[str, str]:
+        group, slot = divmod(code, 10)
+        if slot < _PLAIN_CODES:
+            number = group * _PLAIN_CODES + slot
+            category = self._categories[_mix64(self._key ^ _MASK64 ^ number) % len(self._categories)]
+            return self._stem(number), category
+        number = group * (10 - _PLAIN_CODES) + slot - _PLAIN_CODES
+        category, affix = self._affix(number)
+        stem = self._stem(number)
+        return (affix + stem if affix.endswith("-") else stem + affix), category
+
+    def _candidates(self, word: str) -> Iterator[int]:
+        """Indices that might spell `word`; callers confirm by spelling them"""
+        head, dash, tail = word.partition("-")
+        if not dash:
+            number = self._stem_number(word)
+            if number is not None:
+                group, slot = divmod(number, _PLAIN_CODES)
+                yield self._unpermute(group * 10 + slot)
+            return
+        # Either a prefix (head-) before the stem or a suffix (-tail) after it
+        for stem in (tail, head):
+            number = self._stem_number(stem)
+            if number is not None:
+                group, slot = divmod(number, 10 - _PLAIN_CODES)
+                yield self._unpermute(group * 10 + _PLAIN_CODES + slot)
+
+    # Public lookups
+
+    def entry(self, index: int) -> Tuple[str, str]:
+        """Return the (word, category) at `index`"""
+        cached = self._words.get(index)
+        if cached is not None:
+            self.hits += 1
+            self._words.move_to_end(index)
+            return cached
+        self.misses += 1
+        cached = self._words[index] = self._spell(self._permute(index))
+        if len(self._words) > self.cache_size:
+            self._words.popitem(last=False)
+        return cached
+
+    def word_at(self, index: int) -> str:
+        """Return the word at `index`"""
+        if index < 0 or (self.size is not None and index >= self.size):
+            raise IndexError(index)
+        return self.entry(index)[0]
+
+    def index_of(self, word: str) -> int:
+        """Return the index that spells `word`, or raise KeyError"""
+        if isinstance(word, str):
+            # Round-trip check: only words this language actually spells decode back
+            for index in self._candidates(word):
+                if (self.size is None or index < self.size) and self._spell(self._permute(index))[0] == word:
+                    return index
+        raise KeyError(word)
+
+    def concept_index(self, concept: str) -> int:
+        """Return the index a concept hashes to, a pure function of (seed, concept).
+
+        The permutation gives distinct indices distinct words, so two
+        concepts share a word only when they hash to the same index. That
+        can happen - rarely over the unbounded 2**32 space, as a birthday
+        collision once a bounded `size` holds many concepts - and is never
+        resolved by salting, which would make words depend on lookup order.
+        Use concept_collisions() to check a set of concepts up front.
+        """
+        import hashlib
+
+        space = _CONCEPT_SPACE if self.size is None else min(self.size, _CONCEPT_SPACE)
+        digest = hashlib.blake2b(concept.encode("utf-8"), digest_size=8,
+                                 key=self._key.to_bytes(8, "little")).digest()
+        return int.from_bytes(digest, "little") % space
+
+    def concept_collisions(self, concepts: Iterable[str]) -> Dict[int, List[str]]:
+        """Indices shared by more than one of `concepts`, with the concepts sharing them"""
+        by_index: Dict[int, List[str]] = {}
+        for concept in dict.fromkeys(concepts):
+            by_index.setdefault(self.concept_index(concept), []).append(concept)
+        return {index: shared for index, shared in by_index.items() if len(shared) > 1}
+
+    def word_for(self, concept: str) -> str:
+        """Return the word standing for `concept`"""
+        return self.entry(self.concept_index(concept))[0]
+
+    def __getitem__(self, word: str) -> str:
+        return self.entry(self.index_of(word))[1]
+
+    def __contains__(self, word) -> bool:
+        try:
+            self.index_of(word)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        for index in self._indices():
+            yield self.entry(index)[0]
+
+    def __len__(self) -> int:
+        if self.size is None:
+            raise TypeError("an unbounded LazyVocabulary has no length")
+        return self.size
+
+    def __repr__(self) -> str:
+        size = "unbounded" if self.size is None else f"{self.size} words"
+        return f"LazyVocabulary({size}, {len(self._words)} cached)"
+
+    def _indices(self) -> Iterable[int]:
+        return count() if self.size is None else range(self.size)
+
+    def items(self):
+        return _VocabularyItems(self)
+
+    def _iter_items(self) -> Iterator[Tuple[str, str]]:
+        for index in self._indices():
+            yield self.entry(index)
+
+    def __reduce__(self):
+        # Ship the recipe, not the cache
+        return (LazyVocabulary, (self.phonemes, self.affixes, self.seed, self.size, self.cache_size))
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._categories)
+
+    def spec(self) -> Dict:
+        """JSON-serialisable recipe that rebuilds this vocabulary"""
+        return {"phonemes": self.phonemes, "affixes": self.affixes, "seed": self.seed,
+                "size": self.size, "cache_size": self.cache_size}
+
+    def stats(self) -> Dict[str, int]:
+        return {"cached": len(self._words), "hits": self.hits, "misses": self.misses}
+
+    def memory_usage(self) -> int:
+        """Approximate bytes held by the LRU caches"""
+        cached = sum(sys.getsizeof(entry) + sys.getsizeof(entry[0]) for entry in self._words.values())
+        return cached + sys.getsizeof(self._words)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules live flat in src/, as the app and benchmarks import them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
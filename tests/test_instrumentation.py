@@ -0,0 +1,27 @@
+import tracemalloc
+
+import pytest
+
+import instrumentation
+from language_generator import AncientLanguageGenerator
+
+
+def test_second_capture_reports_running_capture():
+    first = instrumentation.Capture(profile=True, memory=True).start()
+    try:
+        with pytest.raises(RuntimeError, match="capture already running"):
+            instrumentation.Capture(profile=True).start()
+        AncientLanguageGenerator(1).generate_language("Probe", "elvish", word_count=50)
+    finally:
+        first.stop()
+
+    assert "generate_language" in first.profile_text
+    assert not tracemalloc.is_tracing()
+
+
+def test_capture_can_start_again_after_stop():
+    with instrumentation.Capture(profile=True):
+        pass
+    with instrumentation.Capture(profile=False, memory=True) as capture:
+        AncientLanguageGenerator(2).generate_language("Probe", "elvish", word_count=50)
+    assert capture.peak_bytes > 0
@@ -0,0 +1,63 @@
+from language_generator import AncientLanguageGenerator
+
+
+def test_empty_vectorized_vocabulary():
+    generator = AncientLanguageGenerator(5)
+    language = generator.generate_language("Empty", "elvish", word_count=0, vectorized=True)
+    assert len(language["vocabulary"]) == 0
+
+
+def test_extend_vocabulary_by_zero_words():
+    generator = AncientLanguageGenerator(5)
+    language = generator.generate_language("Small", "dwarvish", word_count=20, vectorized=True)
+    assert generator.extend_vocabulary("Small", 0) == {}
+    assert len(language["vocabulary"]) == 20
+
+
+def _family(workers):
+    generator = AncientLanguageGenerator(11)
+    family = generator.create_language_family("Sylvan", num_languages=4, workers=workers)
+    return {name: (language["grammar_type"], list(language["vocabulary"].items()))
+            for name, language in family.items()}
+
+
+def test_language_family_does_not_depend_on_workers():
+    assert _family(workers=1) == _family(workers=2)
+
+
+def test_derived_language_size_follows_extended_base():
+    generator = AncientLanguageGenerator(12)
+    family = generator.create_language_family("Sylvan", num_languages=3)
+    derived = family["Sylvan_1"]["vocabulary"]
+    assert len(derived) == len(list(derived))
+
+    added = generator.extend_vocabulary("Sylvan_prime", 50)
+
+    assert len(derived) == len(list(derived))
+    assert all(word in derived for word in added)
+
+
+def test_derived_pos_index_follows_extended_base():
+    generator = AncientLanguageGenerator(13)
+    family = generator.create_language_family("Sylvan", num_languages=2)
+    derived = family["Sylvan_1"]["vocabulary"]
+    generator._get_pos_index("Sylvan_1")
+
+    generator.extend_vocabulary("Sylvan_prime", 50)
+    index = generator._get_pos_index("Sylvan_1")
+
+    assert sum(len(words) for words in index.values()) == len(derived)
+    assert sorted(word for words in index.values() for word in words) == sorted(derived)
+
+
+def test_derived_pos_index_follows_recategorised_base():
+    generator = AncientLanguageGenerator(14)
+    family = generator.create_language_family("Sylvan", num_languages=2)
+    base, derived = family["Sylvan_prime"]["vocabulary"], family["Sylvan_1"]["vocabulary"]
+    word = next(word for word in derived if word not in derived.added)
+    category = next(name for name in ("noun", "verb") if name != base[word])
+    generator._get_pos_index("Sylvan_1")
+
+    base[word] = category
+
+    assert word in generator._get_pos_index("Sylvan_1")[category]
@@ -0,0 +1,99 @@
+import os
+
+import language_store
+from language_generator import AncientLanguageGenerator
+from language_registry import LanguageRegistry
+
+
+def test_save_registry_language(tmp_path):
+    handle = LanguageRegistry().acquire("Shared", "dwarvish", 3)
+    generator = AncientLanguageGenerator()
+    generator.languages["Shared"] = handle.language
+
+    path = generator.save_language("Shared", str(tmp_path))
+    loaded = AncientLanguageGenerator().load_language(path)
+
+    assert loaded["morphology"] == dict(handle.language["morphology"])
+    assert dict(loaded["vocabulary"]) == dict(handle.language["vocabulary"])
+
+
+def test_load_replaces_language_of_same_name(tmp_path):
+    saved = AncientLanguageGenerator(1)
+    saved.generate_language("Elvish", "elvish", word_count=500, vectorized=True)
+    path = saved.save_language("Elvish", str(tmp_path))
+
+    generator = AncientLanguageGenerator(2)
+    generator.generate_language("Elvish", "elvish", word_count=46, vectorized=True)
+    loaded = generator.load_language(path)
+
+    assert len(loaded["vocabulary"]) == 500
+    assert generator.languages["Elvish"] is loaded
+
+
+def test_round_trip_keeps_vocabulary_and_grammar(tmp_path):
+    generator = AncientLanguageGenerator(3)
+    language = generator.generate_language("Orcish", "orcish", word_count=300)
+    path = str(tmp_path / "orcish.lang")
+    language_store.save_language(language, path)
+
+    loaded = language_store.load_language(path)
+
+    assert loaded["vocabulary"].is_mapped
+    assert list(loaded["vocabulary"].items()) == list(language["vocabulary"].items())
+    assert loaded["vocabulary"].categories == language["vocabulary"].categories
+    assert loaded["morphology"] == language["morphology"]
+    assert loaded["grammar_type"] == language["grammar_type"]
+    assert loaded["script"] == language["script"]
+
+
+def test_lazy_table_maps_entry_on_first_access(tmp_path):
+    saved = AncientLanguageGenerator(4)
+    language = saved.generate_language("Elvish", "elvish", word_count=200)
+    path = saved.save_language("Elvish", str(tmp_path))
+
+    table = language_store.LanguageTable()
+    assert table.register_file(path) == "Elvish"
+    assert "Elvish" in table and not table.is_loaded("Elvish")
+
+    entry = table["Elvish"]
+
+    assert table.is_loaded("Elvish")
+    assert table["Elvish"] is entry
+    assert dict(entry["vocabulary"]) == dict(language["vocabulary"])
+
+
+def test_register_file_again_drops_mapped_entry(tmp_path):
+    saved = AncientLanguageGenerator(5)
+    saved.generate_language("Elvish", "elvish", word_count=200)
+    path = saved.save_language("Elvish", str(tmp_path))
+
+    table = language_store.LanguageTable()
+    table.register_file(path)
+    first = table["Elvish"]
+    table.register_file(path)
+
+    assert len(table) == 1
+    assert not table.is_loaded("Elvish")
+    assert table["Elvish"] is not first
+    assert dict(table["Elvish"]["vocabulary"]) == dict(first["vocabulary"])
+
+
+def test_save_over_attached_store(tmp_path):
+    first = AncientLanguageGenerator(6)
+    first.generate_language("Elvish", "elvish", word_count=300)
+    first.save_language("Elvish", str(tmp_path))
+
+    generator = AncientLanguageGenerator()
+    assert generator.attach_store(str(tmp_path)) == ["Elvish"]
+    mapped = generator.languages["Elvish"]
+    before = dict(mapped["vocabulary"])
+
+    replacement = AncientLanguageGenerator(7)
+    language = replacement.generate_language("Elvish", "elvish", word_count=120)
+    path = replacement.save_language("Elvish", str(tmp_path))
+
+    # The language mapped from the old file still reads the old words
+    assert dict(mapped["vocabulary"]) == before
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+    reloaded = generator.load_language(path)
+    assert dict(reloaded["vocabulary"]) == dict(language["vocabulary"])
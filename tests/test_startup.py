@@ -0,0 +1,16 @@
+import importlib.util
+import os
+
+# The budget and the cold-start script live with the benchmarks
+_spec = importlib.util.spec_from_file_location(
+    "run_benchmarks", os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks", "run_benchmarks.py"))
+run_benchmarks = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(run_benchmarks)
+
+
+def test_cold_start_within_budget():
+    # Best of a few fresh interpreters, each importing the package and
+    # building one of every generator
+    seconds = run_benchmarks.cold_start(repeat=3)
+    assert seconds < run_benchmarks.COLD_START_BUDGET, (
+        f"cold start took {seconds * 1000:.1f} ms, budget {run_benchmarks.COLD_START_BUDGET * 1000:.0f} ms")
@@ -0,0 +1,28 @@
+from language_generator import AncientLanguageGenerator
+from vocabulary import LazyVocabulary
+
+
+def _lazy(size=None, cache_size=4096):
+    return LazyVocabulary(AncientLanguageGenerator.phonemes["elvish"], AncientLanguageGenerator.AFFIXES,
+                          seed=7, size=size, cache_size=cache_size)
+
+
+def test_concept_words_do_not_depend_on_lookup_order():
+    concepts = [f"concept{i}" for i in range(60)]
+    forward = _lazy(size=100, cache_size=8)
+    backward = _lazy(size=100, cache_size=8)
+    words = {concept: forward.word_for(concept) for concept in concepts}
+    assert {concept: backward.word_for(concept) for concept in reversed(concepts)} == words
+    # Again after the LRU has evicted the early lookups
+    assert {concept: forward.word_for(concept) for concept in concepts} == words
+
+
+def test_concept_collisions_match_shared_words():
+    vocabulary = _lazy(size=100)
+    concepts = [f"concept{i}" for i in range(60)]
+    collisions = vocabulary.concept_collisions(concepts)
+    by_word = {}
+    for concept in concepts:
+        by_word.setdefault(vocabulary.word_for(concept), []).append(concept)
+    assert sorted(map(sorted, collisions.values())) == sorted(
+        sorted(shared) for shared in by_word.values() if len(shared) > 1)